@@ -18,6 +18,11 @@ from aiwolf.agent import Agent as Agent
 from aiwolf.agent import Role as Role
 from aiwolf.agent import Species as Species
 from aiwolf.agent import Status as Status
+from aiwolf.agentset import AgentSet as AgentSet
+from aiwolf.claimsledger import Claim as Claim
+from aiwolf.claimsledger import ClaimsLedger as ClaimsLedger
+from aiwolf.client import AsyncTcpipClient as AsyncTcpipClient
+from aiwolf.client import MultiTcpipClient as MultiTcpipClient
 from aiwolf.client import TcpipClient as TcpipClient
 from aiwolf.constant import Constant as Constant
 from aiwolf.content import AgreeContentBuilder as AgreeContentBuilder
@@ -28,6 +33,8 @@ from aiwolf.content import BecauseContentBuilder as BecauseContentBuilder
 from aiwolf.content import ComingoutContentBuilder as ComingoutContentBuilder
 from aiwolf.content import Content as Content
 from aiwolf.content import ContentBuilder as ContentBuilder
+from aiwolf.content import ContentCache as ContentCache
+from aiwolf.content import ContentSyntaxError as ContentSyntaxError
 from aiwolf.content import DayContentBuilder as DayContentBuilder
 from aiwolf.content import DisagreeContentBuilder as DisagreeContentBuilder
 from aiwolf.content import DivinationContentBuilder as DivinationContentBuilder
@@ -49,11 +56,20 @@ from aiwolf.content import VoteContentBuilder as VoteContentBuilder
 from aiwolf.content import VotedContentBuilder as VotedContentBuilder
 from aiwolf.content import XorContentBuilder as XorContentBuilder
 from aiwolf.gameinfo import GameInfo as GameInfo
+from aiwolf.gameinfoarrays import GameInfoArrays as GameInfoArrays
 from aiwolf.gamesetting import GameSetting as GameSetting
 from aiwolf.judge import Judge as Judge
+from aiwolf.launcher import Launcher as Launcher
+from aiwolf.launcher import WorkerStats as WorkerStats
 from aiwolf.player import AbstractPlayer as AbstractPlayer
+from aiwolf.roleassignment import RoleAssignment as RoleAssignment
+from aiwolf.talkindex import TalkIndex as TalkIndex
 from aiwolf.utterance import Talk as Talk
 from aiwolf.utterance import Utterance as Utterance
+from aiwolf.utterance import UtteranceLog as UtteranceLog
+from aiwolf.utterance import UtteranceLogCursor as UtteranceLogCursor
 from aiwolf.utterance import UtteranceType as UtteranceType
 from aiwolf.utterance import Whisper as Whisper
 from aiwolf.vote import Vote as Vote
+from aiwolf.votetally import VoteRound as VoteRound
+from aiwolf.votetally import VoteTally as VoteTally
@@ -25,7 +25,16 @@ from typing import ClassVar, Match, Optional, Pattern
 class Agent:
     """A player agent in AIWolf game."""
 
+    __slots__ = ("_agent_idx", "_str")
+
+    _agent_idx: int
+    _str: str
+
+    # The Agents for the index numbers up to 255 are preallocated in _agent_table and looked up by their string forms
+    # in _name_map, both of which are never modified after import, and the others are made on demand and kept in _agent_map.
+    _agent_table: ClassVar[list[Agent]] = []
     _agent_map: ClassVar[dict[int, Agent]] = {}
+    _name_map: ClassVar[dict[str, Agent]] = {}
 
     _agent_pattern: ClassVar[Pattern[str]] = re.compile(r"(Agent\[(\d+)\]|ANY)")
 
@@ -39,6 +48,9 @@ class Agent:
         Returns:
             The Agent converted from the given string.
         """
+        agent: Optional[Agent] = Agent._name_map.get(input)
+        if agent is not None:
+            return agent
         m: Optional[Match[str]] = Agent._agent_pattern.match(input)
         if m:
             if m.group(1) == "ANY":
@@ -48,20 +60,30 @@ class Agent:
         return Agent(0)
 
     def __new__(cls: type[Agent], idx: int) -> Agent:
-        if idx < 0:
-            raise ValueError("agent index must not be negative")
-        if idx in cls._agent_map.keys():
-            return cls._agent_map[idx]
-        cls._agent_map[idx] = super().__new__(cls)
-        return cls._agent_map[idx]
-
-    def __init__(self, idx: int) -> None:
-        """Initialize a new instance of Agent.
+        """Return the Agent with the given index number.
 
         Args:
             idx: The index number of the Agent.
+
+        Returns:
+            The Agent, which is shared by all the callers with the same index number.
         """
-        self._agent_idx: int = idx
+        if 0 <= idx < 256:
+            return cls._agent_table[idx]
+        if idx < 0:
+            raise ValueError("agent index must not be negative")
+        agent: Optional[Agent] = cls._agent_map.get(idx)
+        if agent is None:
+            # setdefault is atomic, so the threads racing for the same index number all get the Agent stored first.
+            agent = cls._agent_map.setdefault(idx, cls._create(idx))
+        return agent
+
+    @classmethod
+    def _create(cls, idx: int) -> Agent:
+        agent: Agent = super().__new__(cls)
+        agent._agent_idx = idx
+        agent._str = "Agent[" + "{:02}".format(idx) + "]"
+        return agent
 
     @property
     def agent_idx(self) -> int:
@@ -69,7 +91,15 @@ class Agent:
         return self._agent_idx
 
     def __str__(self) -> str:
-        return "Agent[" + "{:02}".format(self.agent_idx) + "]"
+        return self._str
+
+    def __reduce__(self) -> tuple[type[Agent], tuple[int]]:
+        # Unpickled Agents are the same objects as the ones made by Agent(idx).
+        return (Agent, (self._agent_idx,))
+
+
+Agent._agent_table.extend(Agent._create(idx) for idx in range(256))
+Agent._name_map.update({str(agent): agent for agent in Agent._agent_table}, ANY=Agent._agent_table[0xff])
 
 
 class Role(Enum):
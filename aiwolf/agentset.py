@@ -0,0 +1,157 @@
+#
+# agentset.py
+#
+# Copyright 2022 OTSUKI Takashi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""agentset module."""
+from __future__ import annotations
+
+from typing import AbstractSet, Any, Iterable, Iterator, Optional
+
+from aiwolf.agent import Agent
+
+
+class AgentSet(AbstractSet[Agent]):
+    """Immutable set of agents backed by the bitmask whose bit agent_idx is set for each member.
+
+    Membership tests and the set operations with the sets of Agents are done on the integer bitmasks.
+    With the other sets, the operations behave as those of frozenset, and their results are frozensets
+    if they have members other than Agents.
+    """
+
+    __slots__ = ("_mask",)
+
+    def __init__(self, agents: Iterable[Agent] = ()) -> None:
+        """Initialize a new instance of AgentSet.
+
+        Args:
+            agents(optional): The members. Defaults to none.
+        """
+        mask: int = 0
+        for a in agents:
+            mask |= 1 << a.agent_idx
+        self._mask: int = mask
+
+    @staticmethod
+    def from_mask(mask: int) -> AgentSet:
+        """Create an AgentSet from the bitmask.
+
+        Args:
+            mask: The bitmask whose bit agent_idx is set for each member.
+
+        Returns:
+            The AgentSet of the members in the bitmask.
+        """
+        s: AgentSet = AgentSet()
+        s._mask = mask
+        return s
+
+    @property
+    def mask(self) -> int:
+        """The bitmask whose bit agent_idx is set for each member."""
+        return self._mask
+
+    @staticmethod
+    def _mask_of(other: object) -> Optional[int]:
+        # The bitmask of other if it is a set of Agents only, otherwise None to fall back on the generic Set implementation.
+        if isinstance(other, AgentSet):
+            return other._mask
+        if not isinstance(other, AbstractSet):
+            return None
+        mask: int = 0
+        for a in other:
+            if not isinstance(a, Agent):
+                return None
+            mask |= 1 << a.agent_idx
+        return mask
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[Any]) -> AbstractSet[Any]:
+        # Used by the generic Set operators, whose results may have members other than Agents.
+        members: list[Any] = list(it)
+        if all(isinstance(a, Agent) for a in members):
+            return AgentSet(members)
+        return frozenset(members)
+
+    def __contains__(self, agent: object) -> bool:
+        return isinstance(agent, Agent) and self._mask >> agent.agent_idx & 1 == 1
+
+    def __iter__(self) -> Iterator[Agent]:
+        mask: int = self._mask
+        while mask:
+            low: int = mask & -mask
+            yield Agent(low.bit_length() - 1)
+            mask ^= low
+
+    def __len__(self) -> int:
+        return bin(self._mask).count("1")
+
+    def __bool__(self) -> bool:
+        return self._mask != 0
+
+    def __or__(self, other: AbstractSet[Any]) -> AbstractSet[Any]:
+        mask: Optional[int] = AgentSet._mask_of(other)
+        return super().__or__(other) if mask is None else AgentSet.from_mask(self._mask | mask)
+
+    def __and__(self, other: AbstractSet[Any]) -> AbstractSet[Any]:
+        mask: Optional[int] = AgentSet._mask_of(other)
+        return super().__and__(other) if mask is None else AgentSet.from_mask(self._mask & mask)
+
+    def __sub__(self, other: AbstractSet[Any]) -> AbstractSet[Any]:
+        mask: Optional[int] = AgentSet._mask_of(other)
+        return super().__sub__(other) if mask is None else AgentSet.from_mask(self._mask & ~mask)
+
+    def __xor__(self, other: AbstractSet[Any]) -> AbstractSet[Any]:
+        mask: Optional[int] = AgentSet._mask_of(other)
+        return super().__xor__(other) if mask is None else AgentSet.from_mask(self._mask ^ mask)
+
+    def __le__(self, other: AbstractSet[Any]) -> bool:
+        mask: Optional[int] = AgentSet._mask_of(other)
+        return super().__le__(other) if mask is None else self._mask & ~mask == 0
+
+    def __ge__(self, other: AbstractSet[Any]) -> bool:
+        mask: Optional[int] = AgentSet._mask_of(other)
+        return super().__ge__(other) if mask is None else mask & ~self._mask == 0
+
+    def __lt__(self, other: AbstractSet[Any]) -> bool:
+        mask: Optional[int] = AgentSet._mask_of(other)
+        return super().__lt__(other) if mask is None else self._mask & ~mask == 0 and self._mask != mask
+
+    def __gt__(self, other: AbstractSet[Any]) -> bool:
+        mask: Optional[int] = AgentSet._mask_of(other)
+        return super().__gt__(other) if mask is None else mask & ~self._mask == 0 and self._mask != mask
+
+    def __eq__(self, __o: object) -> bool:
+        if isinstance(__o, AgentSet):
+            return self._mask == __o._mask
+        return super().__eq__(__o)
+
+    def __hash__(self) -> int:
+        return self._hash()
+
+    def __repr__(self) -> str:
+        return "AgentSet({" + ", ".join(map(str, self)) + "})" if self._mask else "AgentSet()"
+
+    def isdisjoint(self, other: Iterable[Any]) -> bool:
+        """Return whether this AgentSet has no agent in common with other.
+
+        Args:
+            other: The agents to be compared.
+
+        Returns:
+            True if no agent is in both.
+        """
+        if isinstance(other, AgentSet):
+            return self._mask & other._mask == 0
+        return all(a not in self for a in other)
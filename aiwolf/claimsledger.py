@@ -0,0 +1,233 @@
+#
+# claimsledger.py
+#
+# Copyright 2022 OTSUKI Takashi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""claimsledger module."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Optional
+
+from aiwolf.agent import Agent, Role, Species
+from aiwolf.agentset import AgentSet
+from aiwolf.constant import AGENT_ANY, AGENT_UNSPEC
+from aiwolf.content import Content, Topic
+from aiwolf.gameinfo import GameInfo
+from aiwolf.gameinfoarrays import GameInfoArrays, require_numpy
+from aiwolf.judge import Judge
+from aiwolf.utterance import UtteranceLogCursor
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+
+class Claim:
+    """A claim of coming out, a judgement or an estimate made by an agent."""
+
+    __slots__ = ("agent", "day", "idx", "topic", "target", "role", "result")
+
+    def __init__(self, agent: Agent, day: int, idx: int, topic: Topic, target: Agent, role: Role = Role.UNC, result: Species = Species.UNC) -> None:
+        """Initialize a new instance of Claim.
+
+        Args:
+            agent: The agent that made the claim.
+            day: The date of the claim.
+            idx: The index number of the talk of the claim. -1 for the result of the player's own divination or identification.
+            topic: The topic of the claim, which is COMINGOUT, DIVINED, IDENTIFIED or ESTIMATE.
+            target: The agent the claim is about.
+            role(optional): The role claimed by COMINGOUT or ESTIMATE. Defaults to Role.UNC.
+            result(optional): The species claimed by DIVINED or IDENTIFIED. Defaults to Species.UNC.
+        """
+        self.agent: Agent = agent
+        """The agent that made the claim."""
+
+        self.day: int = day
+        """The date of the claim."""
+
+        self.idx: int = idx
+        """The index number of the talk of the claim. -1 for the result of the player's own divination or identification."""
+
+        self.topic: Topic = topic
+        """The topic of the claim, which is COMINGOUT, DIVINED, IDENTIFIED or ESTIMATE."""
+
+        self.target: Agent = target
+        """The agent the claim is about."""
+
+        self.role: Role = role
+        """The role claimed by COMINGOUT or ESTIMATE."""
+
+        self.result: Species = result
+        """The species claimed by DIVINED or IDENTIFIED."""
+
+
+class ClaimsLedger:
+    """Tables of the claims made in the talks of a game, kept up to date by update.
+
+    Only the top-level COMINGOUT, DIVINED, IDENTIFIED and ESTIMATE made by the speaker itself are claims,
+    and a COMINGOUT counts only when the speaker comes out by itself.
+    The results of the player's own divinations and identifications are recorded as claims of the player.
+    Each claim is put in the tables in constant time, so a new ClaimsLedger should be used for each game.
+    """
+
+    def __init__(self, compile: Callable[[str], Content] = Content.compile) -> None:
+        """Initialize a new instance of ClaimsLedger.
+
+        Args:
+            compile(optional): The function that converts the uttered text into a Content
+                (e.g. ContentCache.compile). Defaults to Content.compile.
+        """
+        self.claim_list: list[Claim] = []
+        """All the claims in the order they were made."""
+
+        self.comingout_map: dict[Agent, Role] = {}
+        """The dict mapping each agent that came out to the role of its latest coming out."""
+
+        self.divined_map: dict[Agent, dict[Agent, Species]] = {}
+        """The dict mapping each agent to the dict of the latest divination results it reported on each target."""
+
+        self.identified_map: dict[Agent, dict[Agent, Species]] = {}
+        """The dict mapping each agent to the dict of the latest identification results it reported on each target."""
+
+        self.estimate_map: dict[Agent, dict[Agent, Role]] = {}
+        """The dict mapping each agent to the dict of the latest role it estimated for each target."""
+
+        self.contradiction_list: list[tuple[Claim, Claim]] = []
+        """The pairs of an earlier claim and a later one contradicting it.
+
+        A coming out contradicts the earlier one of a different role by the same agent, and a judgement contradicts
+        the earliest one of the other species on the same target, whether it was a divination or an identification."""
+
+        self._compile: Callable[[str], Content] = compile
+        self._comingout_claim_map: dict[Agent, Claim] = {}
+        self._comingout_mask_map: dict[Role, int] = {}
+        self._species_claim_map: dict[tuple[Agent, Species], Claim] = {}
+        self._judge_key_set: set[tuple[Topic, int, Agent]] = set()
+        self._cursor: UtteranceLogCursor = UtteranceLogCursor()
+
+    def update(self, game_info: GameInfo) -> None:
+        """Add the claims in the talks and the judgements of the given GameInfo that are not added yet.
+
+        Args:
+            game_info: The GameInfo to be reflected.
+        """
+        for talk in self._cursor.read(game_info.talk_log):
+            self.add(talk.agent, talk.day, talk.idx, self._compile(talk.text))
+        if game_info.divine_result is not None:
+            self.add_judge(game_info.divine_result, Topic.DIVINED)
+        if game_info.medium_result is not None:
+            self.add_judge(game_info.medium_result, Topic.IDENTIFIED)
+
+    def add(self, agent: Agent, day: int, idx: int, content: Content) -> None:
+        """Add the claim in the Content of a talk if it is one.
+
+        Args:
+            agent: The speaker of the talk.
+            day: The date of the talk.
+            idx: The index number of the talk.
+            content: The Content of the talk.
+        """
+        if content.subject is not AGENT_UNSPEC and content.subject is not agent or content.target is AGENT_ANY:
+            return
+        if content.topic is Topic.COMINGOUT or content.topic is Topic.ESTIMATE:
+            if content.role is not Role.UNC and content.role is not Role.ANY and (content.topic is Topic.ESTIMATE or content.target is agent):
+                self._add_claim(Claim(agent, day, idx, content.topic, content.target, role=content.role))
+        elif content.topic is Topic.DIVINED or content.topic is Topic.IDENTIFIED:
+            if content.result is Species.HUMAN or content.result is Species.WEREWOLF:
+                self._add_claim(Claim(agent, day, idx, content.topic, content.target, result=content.result))
+
+    def add_judge(self, judge: Judge, topic: Topic) -> None:
+        """Add the result of the player's own divination or identification unless it is already added.
+
+        Args:
+            judge: The Judge of the result.
+            topic: Topic.DIVINED for the divination, Topic.IDENTIFIED for the identification.
+        """
+        key: tuple[Topic, int, Agent] = (topic, judge.day, judge.target)
+        if key not in self._judge_key_set and (judge.result is Species.HUMAN or judge.result is Species.WEREWOLF):
+            self._judge_key_set.add(key)
+            self._add_claim(Claim(judge.agent, judge.day, -1, topic, judge.target, result=judge.result))
+
+    def _add_claim(self, claim: Claim) -> None:
+        self.claim_list.append(claim)
+        if claim.topic is Topic.COMINGOUT:
+            last: Optional[Claim] = self._comingout_claim_map.get(claim.agent)
+            if last is not None and last.role is not claim.role:
+                self.contradiction_list.append((last, claim))
+                self._comingout_mask_map[last.role] &= ~(1 << claim.agent.agent_idx)
+            self._comingout_mask_map[claim.role] = self._comingout_mask_map.get(claim.role, 0) | 1 << claim.agent.agent_idx
+            self._comingout_claim_map[claim.agent] = claim
+            self.comingout_map[claim.agent] = claim.role
+        elif claim.topic is Topic.ESTIMATE:
+            self.estimate_map.setdefault(claim.agent, {})[claim.target] = claim.role
+        else:
+            (self.divined_map if claim.topic is Topic.DIVINED else self.identified_map).setdefault(claim.agent, {})[claim.target] = claim.result
+            other: Species = Species.WEREWOLF if claim.result is Species.HUMAN else Species.HUMAN
+            conflict: Optional[Claim] = self._species_claim_map.get((claim.target, other))
+            if conflict is not None:
+                self.contradiction_list.append((conflict, claim))
+            self._species_claim_map.setdefault((claim.target, claim.result), claim)
+
+    def comingout_agent_set(self, role: Optional[Role] = None) -> AgentSet:
+        """Return the set of the agents whose latest coming out is of the given role.
+
+        Args:
+            role(optional): The role. Defaults to any role.
+
+        Returns:
+            The AgentSet of the agents.
+        """
+        if role is None:
+            return AgentSet(self.comingout_map.keys())
+        return AgentSet.from_mask(self._comingout_mask_map.get(role, 0))
+
+    def comingout_array(self, agent_num: int) -> npt.NDArray[np.int8]:
+        """Return the roles of the latest coming out of the agents as an array.
+
+        Args:
+            agent_num: The number of agents in the game.
+
+        Returns:
+            The array of the role codes (indices into GameInfoArrays.roles) indexed by agent_idx - 1.
+            0 (Role.UNC) for the agents that have not come out.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        numpy = require_numpy("ClaimsLedger")
+        array: npt.NDArray[np.int8] = numpy.zeros(agent_num, dtype=numpy.int8)
+        for agent, role in self.comingout_map.items():
+            array[agent.agent_idx - 1] = GameInfoArrays.role_code(role)
+        return array
+
+    def judge_array(self, agent_num: int, topic: Topic = Topic.DIVINED) -> npt.NDArray[np.int8]:
+        """Return the latest reported results of the divinations or the identifications as a matrix.
+
+        Args:
+            agent_num: The number of agents in the game.
+            topic(optional): Topic.DIVINED for the divinations, Topic.IDENTIFIED for the identifications. Defaults to Topic.DIVINED.
+
+        Returns:
+            The array indexed by the agent_idx - 1 of the reporter and that of the target,
+            which is 1 for HUMAN, -1 for WEREWOLF and 0 for no report.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        numpy = require_numpy("ClaimsLedger")
+        array: npt.NDArray[np.int8] = numpy.zeros((agent_num, agent_num), dtype=numpy.int8)
+        for agent, results in (self.divined_map if topic is Topic.DIVINED else self.identified_map).items():
+            for target, result in results.items():
+                array[agent.agent_idx - 1, target.agent_idx - 1] = 1 if result is Species.HUMAN else -1
+        return array
@@ -15,14 +15,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """client module."""
+import asyncio
+import inspect
 import json
+import selectors
 import socket
-from typing import Optional, TypedDict
+from functools import partial
+from typing import Any, Awaitable, Callable, ClassVar, Optional, TypedDict, TypeVar, Union
 
+from aiwolf.agent import Agent
+from aiwolf.content import Content
 from aiwolf.gameinfo import GameInfo, _GameInfo
 from aiwolf.gamesetting import GameSetting, _GameSetting
 from aiwolf.player import AbstractPlayer
-from aiwolf.utterance import Talk, Whisper, _Utterance
+from aiwolf.utterance import Talk, Utterance, UtteranceLog, Whisper, _Utterance
 
 
 class _Packet(TypedDict):
@@ -33,11 +39,86 @@ class _Packet(TypedDict):
     whisperHistory: Optional[list[_Utterance]]
 
 
-class TcpipClient:
-    """Client agent that communiates with the server via TCP/IP connection."""
+_T = TypeVar("_T")
+_U = TypeVar("_U", bound=Utterance)
+_Call = Callable[[], Any]
+_Respond = Callable[[Any], Optional[str]]
 
-    def __init__(self, player: AbstractPlayer, name: Optional[str], host: str, port: int, request_role: str) -> None:
-        """Initialize a new instance of TcpipClient.
+
+def _no_response(_: object) -> None:
+    return None
+
+
+def _agent_response(agent: Agent) -> str:
+    return json.dumps({"agentIdx": agent.agent_idx}, separators=(",", ":"))
+
+
+def _text_response(content: Content) -> str:
+    return content.text
+
+
+class _PacketReader:
+    """Splits the byte stream from the server into newline-terminated packets."""
+
+    def __init__(self) -> None:
+        self._buffer: bytearray = bytearray()
+        self._scanned: int = 0
+        self.received_bytes: int = 0
+        self.packet_num: int = 0
+
+    def feed(self, data: bytes) -> list[_Packet]:
+        """Append the received bytes and return the packets completed by them.
+
+        Args:
+            data: The bytes received from the server.
+
+        Returns:
+            The list of the packets whose terminating newline has been received.
+        """
+        self._buffer += data
+        self.received_bytes += len(data)
+        packets: list[_Packet] = []
+        start: int = 0
+        # The bytes before _scanned are known to contain no newline, so they are never searched again.
+        end: int = self._buffer.find(b"\n", self._scanned)
+        while end >= 0:
+            if end > start:
+                packets.append(json.loads(self._buffer[start:end]))
+            start = end + 1
+            end = self._buffer.find(b"\n", start)
+        del self._buffer[:start]
+        self._scanned = len(self._buffer)
+        self.packet_num += len(packets)
+        return packets
+
+    def flush(self) -> list[_Packet]:
+        """Return the last packet that is not terminated by a newline, if any.
+
+        Returns:
+            The list containing the remaining packet, which is empty if there is none.
+        """
+        packets: list[_Packet] = [json.loads(self._buffer)] if self._buffer.strip() else []
+        self._buffer.clear()
+        self._scanned = 0
+        self.packet_num += len(packets)
+        return packets
+
+
+def _append_new_utterances(utterance_list: list[_U], utterance_list0: list[_Utterance], compile: Callable[[_Utterance], _U]) -> bool:
+    appended: bool = False
+    for utterance0 in utterance_list0:
+        if len(utterance_list) == 0 or utterance0["day"] > utterance_list[-1].day \
+                or (utterance0["day"] == utterance_list[-1].day and utterance0["idx"] > utterance_list[-1].idx):
+            utterance_list.append(compile(utterance0))
+            appended = True
+    return appended
+
+
+class _Client:
+    """Base class of the clients, which keeps the game information sent by the server."""
+
+    def __init__(self, player: AbstractPlayer, name: Optional[str], host: str, port: int, request_role: str, *, incremental: bool = False) -> None:
+        """Initialize a new instance of the client.
 
         Args:
             player: An AbstractPlayer to be connect with the server.
@@ -45,107 +126,264 @@ class TcpipClient:
             host: The hostname of the server.
             port: The port number the server is waiting on.
             request_role: The name of role that the player agent wants to be.
+            incremental(optional): Whether or not one GameInfo is kept through a game and updated in place. Defaults to False.
         """
         self.player: AbstractPlayer = player
         self.name: Optional[str] = name
         self.host: str = host
         self.port: int = port
         self.request_role: str = request_role
+        self.incremental: bool = incremental
         self.game_info: Optional[GameInfo] = None
         self.last_game_info: Optional[GameInfo] = None
-        self.sock: Optional[socket.socket] = None
-
-    def _send_response(self, response: Optional[str]) -> None:
-        if isinstance(self.sock, socket.socket) and isinstance(response, str):
-            self.sock.send((response + "\n").encode("utf-8"))
+        self.talk_log: UtteranceLog[Talk] = UtteranceLog(Talk.compile)
+        self.whisper_log: UtteranceLog[Whisper] = UtteranceLog(Whisper.compile)
 
-    def _get_response(self, packet: _Packet) -> Optional[str]:
-        request: str = packet["request"]
-        if request == "NAME":
-            return self.name if self.name is not None else self.player.get_name()
-        elif request == "ROLE":
-            return self.request_role
+    def _update_game_info(self, packet: _Packet) -> Optional[GameInfo]:
         game_info0: Optional[_GameInfo] = packet["gameInfo"]
-        self.game_info = GameInfo(game_info0) if game_info0 is not None else None
-        if self.game_info is None:
+        if game_info0 is None:
+            self.game_info = self.last_game_info
+            if self.game_info is not None:
+                self.game_info.updated_fields = set()
+        elif packet["request"] == "INITIALIZE":
+            self.talk_log = UtteranceLog(Talk.compile)
+            self.whisper_log = UtteranceLog(Whisper.compile)
+            self.game_info = GameInfo(game_info0, self.talk_log, self.whisper_log)
+        elif self.incremental and self.last_game_info is not None:
             self.game_info = self.last_game_info
+            self.game_info.update(game_info0)
         else:
-            self.last_game_info = self.game_info
+            self.game_info = GameInfo(game_info0, self.talk_log, self.whisper_log)
+        self.last_game_info = self.game_info
         if self.game_info is None:
             return None
         talk_history0: Optional[list[_Utterance]] = packet["talkHistory"]
-        if talk_history0 is not None:
-            for talk0 in talk_history0:
-                talk: Talk = Talk.compile(talk0)
-                talk_list: list[Talk] = self.game_info.talk_list
-                if len(talk_list) == 0:
-                    talk_list.append(talk)
-                else:
-                    last_talk: Talk = talk_list[-1]
-                    if talk.day > last_talk.day or (talk.day == last_talk.day and talk.idx > last_talk.idx):
-                        talk_list.append(talk)
+        if talk_history0 is not None and _append_new_utterances(self.game_info.talk_list, talk_history0, self.game_info.talk_log.add):
+            self.game_info.updated_fields.add("talk_list")
         whisper_history0: Optional[list[_Utterance]] = packet["whisperHistory"]
-        if whisper_history0 is not None:
-            for whisper0 in whisper_history0:
-                whisper: Whisper = Whisper.compile(whisper0)
-                whisper_list: list[Whisper] = self.game_info.whisper_list
-                if len(whisper_list) == 0:
-                    whisper_list.append(whisper)
-                else:
-                    last_whisper: Whisper = whisper_list[-1]
-                    if whisper.day > last_whisper.day or (whisper.day == last_whisper.day and whisper.idx > last_whisper.idx):
-                        whisper_list.append(whisper)
+        if whisper_history0 is not None and _append_new_utterances(self.game_info.whisper_list, whisper_history0, self.game_info.whisper_log.add):
+            self.game_info.updated_fields.add("whisper_list")
+        return self.game_info
+
+    def _dispatch(self, packet: _Packet) -> tuple[list[_Call], _Respond]:
+        # The calls to the player are made in order, and the result of the last one is turned into the response.
+        request: str = packet["request"]
+        if request == "NAME":
+            if self.name is not None:
+                return [], lambda _: self.name
+            return [self.player.get_name], lambda name: name
+        elif request == "ROLE":
+            return [], lambda _: self.request_role
+        game_info: Optional[GameInfo] = self._update_game_info(packet)
+        if game_info is None:
+            return [], _no_response
         if request == "INITIALIZE":
             game_setting0: Optional[_GameSetting] = packet["gameSetting"]
-            if game_setting0 is not None:
-                self.player.initialize(self.game_info, GameSetting(game_setting0))
-            return None
-        else:
-            self.player.update(self.game_info)
-            if request == "DAILY_INITIALIZE":
-                self.player.day_start()
-                return None
-            elif request == "DAILY_FINISH":
-                return None
-            elif request == "FINISH":
-                self.player.finish()
-                return None
-            elif request == "VOTE":
-                return json.dumps({"agentIdx": self.player.vote().agent_idx}, separators=(",", ":"))
-            elif request == "ATTACK":
-                return json.dumps({"agentIdx": self.player.attack().agent_idx}, separators=(",", ":"))
-            elif request == "GUARD":
-                return json.dumps({"agentIdx": self.player.guard().agent_idx}, separators=(",", ":"))
-            elif request == "DIVINE":
-                return json.dumps({"agentIdx": self.player.divine().agent_idx}, separators=(",", ":"))
-            elif request == "TALK":
-                return self.player.talk().text
-            elif request == "WHISPER":
-                return self.player.whisper().text
-            return None
+            if game_setting0 is None:
+                return [], _no_response
+            return [partial(self.player.initialize, game_info, GameSetting(game_setting0))], _no_response
+        update: _Call = partial(self.player.update, game_info)
+        if request == "DAILY_INITIALIZE":
+            return [update, self.player.day_start], _no_response
+        elif request == "FINISH":
+            return [update, self.player.finish], _no_response
+        elif request == "VOTE":
+            return [update, self.player.vote], _agent_response
+        elif request == "ATTACK":
+            return [update, self.player.attack], _agent_response
+        elif request == "GUARD":
+            return [update, self.player.guard], _agent_response
+        elif request == "DIVINE":
+            return [update, self.player.divine], _agent_response
+        elif request == "TALK":
+            return [update, self.player.talk], _text_response
+        elif request == "WHISPER":
+            return [update, self.player.whisper], _text_response
+        return [update], _no_response
 
-    def connect(self) -> None:
-        """Connect to the server."""
+
+class TcpipClient(_Client):
+    """Client agent that communiates with the server via TCP/IP connection."""
+
+    def __init__(self, player: AbstractPlayer, name: Optional[str], host: str, port: int, request_role: str, *, incremental: bool = False) -> None:
+        """Initialize a new instance of TcpipClient.
+
+        Args:
+            player: An AbstractPlayer to be connect with the server.
+            name: The name of the player agent.
+            host: The hostname of the server.
+            port: The port number the server is waiting on.
+            request_role: The name of role that the player agent wants to be.
+            incremental(optional): Whether or not one GameInfo is kept through a game and updated in place. Defaults to False.
+        """
+        super().__init__(player, name, host, port, request_role, incremental=incremental)
+        self.sock: Optional[socket.socket] = None
+        self._reader: _PacketReader = _PacketReader()
+
+    @property
+    def packet_num(self) -> int:
+        """The number of the packets received in the last connection."""
+        return self._reader.packet_num
+
+    @property
+    def received_bytes(self) -> int:
+        """The number of the bytes received in the last connection."""
+        return self._reader.received_bytes
+
+    def _send_response(self, response: Optional[str]) -> None:
+        if isinstance(self.sock, socket.socket) and isinstance(response, str):
+            self.sock.sendall((response + "\n").encode("utf-8"))
+
+    def _get_response(self, packet: _Packet) -> Optional[str]:
+        calls, respond = self._dispatch(packet)
+        result: Any = None
+        for call in calls:
+            result = call()
+        return respond(result)
+
+    def _open(self) -> socket.socket:
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sock.settimeout(0.001)
         self.sock.connect((self.host, self.port))
-        line: str = ""
-        while True:
-            try:
-                line += self.sock.recv(8192).decode("utf-8")
-                if line == "":
+        self._reader = _PacketReader()
+        return self.sock
+
+    def _receive(self) -> bool:
+        if self.sock is None:
+            return False
+        # Block until the server sends something; an empty read means the server closed the connection.
+        received: bytes = self.sock.recv(8192)
+        if not received:
+            for packet in self._reader.flush():
+                self._send_response(self._get_response(packet))
+            self.sock.close()
+            return False
+        for packet in self._reader.feed(received):
+            self._send_response(self._get_response(packet))
+        return True
+
+    def connect(self) -> None:
+        """Connect to the server."""
+        self._open()
+        while self._receive():
+            pass
+        return None
+
+
+class MultiTcpipClient:
+    """Client that connects many player agents with the server and serves all of them in one thread."""
+
+    def __init__(self, players: list[tuple[AbstractPlayer, Optional[str], str]], host: str, port: int, *, incremental: bool = False) -> None:
+        """Initialize a new instance of MultiTcpipClient.
+
+        Args:
+            players: The list of the tuples of a player agent, its name and the name of role it wants to be.
+            host: The hostname of the server.
+            port: The port number the server is waiting on.
+            incremental(optional): Whether or not one GameInfo is kept through a game and updated in place. Defaults to False.
+        """
+        self.clients: list[TcpipClient] = [TcpipClient(player, name, host, port, request_role, incremental=incremental)
+                                           for player, name, request_role in players]
+        """The clients connecting each player agent with the server."""
+
+        self.host: str = host
+        self.port: int = port
+        self.error_list: list[Optional[str]] = [None] * len(self.clients)
+        """The descriptions of the errors that stopped each player agent in the last connection, or None for those that finished cleanly."""
+
+    def connect(self) -> None:
+        """Connect all the player agents to the server and serve them until the server closes every connection.
+
+        An error raised by a player agent closes only its own connection and is recorded in error_list,
+        so that the other player agents keep playing.
+        """
+        self.error_list = [None] * len(self.clients)
+        selector: selectors.BaseSelector = selectors.DefaultSelector()
+        try:
+            for i, client in enumerate(self.clients):
+                try:
+                    selector.register(client._open(), selectors.EVENT_READ, i)
+                except Exception as e:
+                    self._close(i, e)
+            while selector.get_map():
+                for key, _ in selector.select():
+                    i = key.data
+                    try:
+                        # The socket is readable, so recv returns without blocking.
+                        if self.clients[i]._receive():
+                            continue
+                        error: Optional[Exception] = None
+                    except Exception as e:
+                        error = e
+                    selector.unregister(key.fileobj)
+                    self._close(i, error)
+        finally:
+            for client in self.clients:
+                if client.sock is not None:
+                    client.sock.close()
+            selector.close()
+        return None
+
+    def _close(self, i: int, error: Optional[Exception]) -> None:
+        sock: Optional[socket.socket] = self.clients[i].sock
+        if sock is not None:
+            sock.close()
+        if error is not None:
+            self.error_list[i] = repr(error)
+
+
+async def _resolve(value: Union[_T, Awaitable[_T]]) -> _T:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class AsyncTcpipClient(_Client):
+    """Client agent that communiates with the server via asyncio streams.
+
+    Each method of the player may be either an ordinary method or a coroutine function,
+    so that many agents can share one event loop.
+    """
+
+    _limit: ClassVar[int] = 1 << 24
+    """The maximum length of a packet."""
+
+    def __init__(self, player: AbstractPlayer, name: Optional[str], host: str, port: int, request_role: str, *, incremental: bool = False) -> None:
+        """Initialize a new instance of AsyncTcpipClient.
+
+        Args:
+            player: An AbstractPlayer to be connect with the server.
+            name: The name of the player agent.
+            host: The hostname of the server.
+            port: The port number the server is waiting on.
+            request_role: The name of role that the player agent wants to be.
+            incremental(optional): Whether or not one GameInfo is kept through a game and updated in place. Defaults to False.
+        """
+        super().__init__(player, name, host, port, request_role, incremental=incremental)
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def _send_response(self, response: Optional[str]) -> None:
+        if isinstance(self.writer, asyncio.StreamWriter) and isinstance(response, str):
+            self.writer.write((response + "\n").encode("utf-8"))
+            await self.writer.drain()
+
+    async def _get_response(self, packet: _Packet) -> Optional[str]:
+        calls, respond = self._dispatch(packet)
+        result: Any = None
+        for call in calls:
+            result = await _resolve(call())
+        return respond(result)
+
+    async def connect(self) -> None:
+        """Connect to the server."""
+        reader, self.writer = await asyncio.open_connection(self.host, self.port, limit=AsyncTcpipClient._limit)
+        try:
+            while True:
+                line: bytes = await reader.readline()
+                if line.strip():
+                    await self._send_response(await self._get_response(json.loads(line)))
+                if not line.endswith(b"\n"):
                     break
-            except socket.timeout:
-                pass
-            line_list: list[str] = line.split("\n", 1)
-            for i in range(len(line_list) - 1):
-                if len(line_list[i]) > 0:
-                    self._send_response(self._get_response(json.loads(line_list[i])))
-                line = line_list[-1]
-            try:
-                self._send_response(self._get_response(json.loads(line)))
-                line = ""
-            except ValueError:
-                pass
-        self.sock.close()
+        finally:
+            self.writer.close()
+            await self.writer.wait_closed()
         return None
@@ -17,136 +17,182 @@
 """content module."""
 from __future__ import annotations
 
-import copy
+import multiprocessing
+import os
 import re
 from enum import Enum
-from typing import ClassVar, Match, Optional, Pattern
+from collections import OrderedDict, deque
+from multiprocessing.pool import AsyncResult
+from typing import Any, ClassVar, Iterable, Iterator, Match, Optional, Pattern, Sequence
+from weakref import WeakValueDictionary
 
 from aiwolf.agent import Agent, Role, Species
 from aiwolf.constant import AGENT_ANY, AGENT_NONE, AGENT_UNSPEC
 from aiwolf.utterance import Talk, Utterance, UtteranceType, Whisper
 
+_UtteranceKey = tuple[type[Utterance], int, Agent, int, str, int]
+
+
+def _utterance_key(utterance: Utterance) -> _UtteranceKey:
+    return (type(utterance), utterance.day, utterance.agent, utterance.idx, utterance.text, utterance.turn)
+
 
 class Content:
-    """Content class expressing the content of an uteerance."""
+    """Content class expressing the content of an uteerance.
 
-    @staticmethod
-    def _get_contents(input: str) -> list[Content]:
-        return [Content.compile(s) for s in Content._get_content_strings(input)]
+    Content is immutable and hashable, and structurally identical Contents are interned as one object.
+    Two Contents are equal if their texts are equal.
+    """
 
-    @staticmethod
-    def _get_content_strings(input: str) -> list[str]:
-        strings: list[str] = []
-        length: int = len(input)
-        stack_ptr: int = 0
-        start: int = 0
-        for i in range(0, length):
-            if input[i] == "(":
-                if stack_ptr == 0:
-                    start = i
-                stack_ptr += 1
-            elif input[i] == ")":
-                stack_ptr -= 1
-                if stack_ptr == 0:
-                    strings.append(input[start+1:i])
-        return strings
-
-    def __init__(self, builder: ContentBuilder) -> None:
-        """Initialize a new instance of Content.
+    __slots__ = ("topic", "subject", "target", "role", "result", "_utterance", "operator", "content_list", "day", "_text",
+                 "_raw_text", "__weakref__")
 
-        Args:
-            builder: A ContentBuilder used for initialization.
-        """
-        self.topic: Topic = builder._topic
-        """The topic of this Content."""
+    topic: Topic
+    """The topic of this Content."""
 
-        self.subject: Agent = builder._subject
-        """The Agent that is the subject of this Content."""
+    subject: Agent
+    """The Agent that is the subject of this Content."""
 
-        self.target: Agent = builder._target
-        """The Agent that is the object of this Content."""
+    target: Agent
+    """The Agent that is the object of this Content."""
 
-        self.role: Role = builder._role
-        """The role this Content refers to."""
+    role: Role
+    """The role this Content refers to."""
 
-        self.result: Species = builder._result
-        """The species this Content refers to."""
+    result: Species
+    """The species this Content refers to."""
 
-        self.utterance: Utterance = builder._utterance
-        """The utterance this Content refers to."""
+    operator: Operator
+    """The operator in this Content."""
 
-        self.operator: Operator = builder._operator
-        """The operator in this Content."""
+    content_list: tuple[Content, ...]
+    """The operands in this Content."""
 
-        self.content_list: list[Content] = builder._content_list
-        """The list of the operands in this Content."""
+    day: int
+    """The date added to the operand in this Content."""
 
-        self.day: int = builder._day
-        """The date added to the operand in this Content."""
+    _utterance: _UtteranceKey
+    _text: Optional[str]
+    _raw_text: str
 
-        self.text: str = ""
-        """The text representing this Content."""
+    _content_map: ClassVar[WeakValueDictionary[tuple[object, ...], Content]] = WeakValueDictionary()
 
-        self._complete_inner_subject()
-        self._normalize_text()
+    def __new__(cls, builder: ContentBuilder) -> Content:
+        """Return the Content built by the ContentBuilder.
 
-    def _complete_inner_subject(self) -> None:
-        if not self.content_list:
-            return
-        self.content_list = [self._process_inner_content(c) for c in self.content_list]
+        Args:
+            builder: A ContentBuilder used for initialization.
+
+        Returns:
+            The Content, which is shared with the structurally identical Contents built before.
+        """
+        return Content._create(builder._topic, builder._subject, builder._target, builder._role, builder._result,
+                               _utterance_key(builder._utterance), builder._operator, builder._content_list, builder._day, builder._text)
 
-    def _process_inner_content(self, inner: Content) -> Content:
+    @staticmethod
+    def _create(topic: Topic, subject: Agent, target: Agent, role: Role, result: Species, utterance: _UtteranceKey,
+                operator: Operator, content_list: Iterable[Content], day: int, raw_text: str) -> Content:
+        content_list = tuple(Content._process_inner_content(operator, subject, target, c) for c in content_list)
+        # The operands are keyed by identity since they are interned themselves and kept alive by the Content.
+        key: tuple[object, ...] = (topic, subject, target, role, result, utterance, operator, tuple(map(id, content_list)), day, raw_text)
+        content: Optional[Content] = Content._content_map.get(key)
+        if content is not None:
+            return content
+        content = object.__new__(Content)
+        for name, value in (("topic", topic), ("subject", subject), ("target", target), ("role", role), ("result", result),
+                            ("_utterance", utterance), ("operator", operator), ("content_list", content_list), ("day", day),
+                            ("_text", None), ("_raw_text", raw_text)):
+            object.__setattr__(content, name, value)
+        Content._content_map[key] = content
+        return content
+
+    @staticmethod
+    def _process_inner_content(operator: Operator, subject: Agent, target: Agent, inner: Content) -> Content:
         if inner.subject is AGENT_UNSPEC:
-            if self.operator is Operator.INQUIRE or self.operator is Operator.REQUEST:
-                return inner._copy_and_replace_subject(self.target)
-            if self.subject is not AGENT_UNSPEC:
-                return inner._copy_and_replace_subject(self.subject)
-        inner._complete_inner_subject()
+            new_subject: Agent = target if operator is Operator.INQUIRE or operator is Operator.REQUEST else subject
+            if new_subject is not AGENT_UNSPEC:
+                return inner._copy_and_replace_subject(new_subject)
         return inner
 
     def _copy_and_replace_subject(self, new_subject: Agent) -> Content:
-        c: Content = self.clone()
-        c.subject = new_subject
-        c._complete_inner_subject()
-        c._normalize_text()
-        return c
-
-    def _normalize_text(self) -> None:
-        str_sub: str = "" if self.subject is AGENT_UNSPEC else "ANY " if self.subject is AGENT_ANY else str(self.subject)+" "
+        return Content._create(self.topic, new_subject, self.target, self.role, self.result, self._utterance,
+                               self.operator, self.content_list, self.day, self._raw_text)
+
+    def _write_text(self, parts: list[str], with_subject: bool) -> None:
+        # Append the text of this Content, optionally without its subject, to parts in a single pass over the tree.
+        topic: Topic = self.topic
+        if topic is Topic.DUMMY:
+            return
+        if topic is Topic.RAW:
+            parts.append(self._raw_text if with_subject else Content._strip_subject(self._raw_text))
+            return
+        if topic is Topic.Skip:
+            parts.append(Utterance.SKIP)
+            return
+        if topic is Topic.Over:
+            parts.append(Utterance.OVER)
+            return
+        str_sub: str = "" if not with_subject or self.subject is AGENT_UNSPEC else "ANY " if self.subject is AGENT_ANY else str(self.subject)+" "
         str_tgt: str = "ANY" if self.target is AGENT_ANY or self.target is AGENT_UNSPEC else str(self.target)
-        if self.topic is not Topic.OPERATOR:
-            if self.topic is Topic.DUMMY:
-                self.text = ""
-            elif self.topic is Topic.RAW:
-                pass
-            elif self.topic is Topic.Skip:
-                self.text = Utterance.SKIP
-            elif self.topic is Topic.Over:
-                self.text = Utterance.OVER
-            elif self.topic is Topic.AGREE or self.topic is Topic.DISAGREE:
-                self.text = str_sub + " ".join([self.topic.value, "TALK" if type(self.utterance) is Talk else "WHISPER", str(self.utterance.day), str(self.utterance.idx)])
-            elif self.topic is Topic.ESTIMATE or self.topic is Topic.COMINGOUT:
-                self.text = str_sub + " ".join([self.topic.value, str_tgt, self.role.value])
-            elif self.topic is Topic.DIVINED or self.topic is Topic.IDENTIFIED:
-                self.text = str_sub + " ".join([self.topic.value, str_tgt, self.result.value])
-            elif self.topic is Topic.ATTACK or self.topic is Topic.ATTACKED or self.topic is Topic.DIVINATION or self.topic is Topic.GUARD\
-                    or self.topic is Topic.GUARDED or self.topic is Topic.VOTE or self.topic is Topic.VOTED:
-                self.text = str_sub + " ".join([self.topic.value, str_tgt])
+        if topic is not Topic.OPERATOR:
+            if topic is Topic.AGREE or topic is Topic.DISAGREE:
+                parts.append(str_sub + " ".join([topic.value, "TALK" if self._utterance[0] is Talk else "WHISPER", f"day{self._utterance[1]}", f"ID:{self._utterance[3]}"]))
+            elif topic is Topic.ESTIMATE or topic is Topic.COMINGOUT:
+                parts.append(str_sub + " ".join([topic.value, str_tgt, self.role.value]))
+            elif topic is Topic.DIVINED or topic is Topic.IDENTIFIED:
+                parts.append(str_sub + " ".join([topic.value, str_tgt, self.result.value]))
+            elif topic is Topic.ATTACK or topic is Topic.ATTACKED or topic is Topic.DIVINATION or topic is Topic.GUARD\
+                    or topic is Topic.GUARDED or topic is Topic.VOTE or topic is Topic.VOTED:
+                parts.append(str_sub + " ".join([topic.value, str_tgt]))
+            return
+        operator: Operator = self.operator
+        operands: Sequence[Content]
+        subject: Agent = self.subject
+        if operator is Operator.REQUEST or operator is Operator.INQUIRE:
+            parts.append(str_sub + operator.value + " " + str_tgt)
+            operands = [self.content_list[0]]
+            subject = self.target
+        elif operator is Operator.BECAUSE or operator is Operator.XOR:
+            parts.append(str_sub + operator.value)
+            operands = [self.content_list[0], self.content_list[1]]
+        elif operator is Operator.AND or operator is Operator.OR:
+            parts.append(str_sub + operator.value)
+            operands = self.content_list
+        elif operator is Operator.NOT:
+            parts.append(str_sub + operator.value)
+            operands = [self.content_list[0]]
+        elif operator is Operator.DAY:
+            parts.append(str_sub + operator.value + " " + str(self.day))
+            operands = [self.content_list[0]]
         else:
-            if self.operator is Operator.REQUEST or self.operator is Operator.INQUIRE:
-                self.text = str_sub + " ".join([self.operator.value, str_tgt, "("+Content._strip_subject(self.content_list[0].text) +
-                                                ")" if self.content_list[0].subject is self.target else "("+self.content_list[0].text+")"])
-            elif self.operator is Operator.BECAUSE or self.operator is Operator.XOR:
-                self.text = str_sub + " ".join([self.operator.value] + ["("+Content._strip_subject(self.content_list[i].text) +
-                                                                        ")" if self.content_list[i].subject is self.subject else "("+self.content_list[i].text+")" for i in [0, 1]])
-            elif self.operator is Operator.AND or self.operator is Operator.OR:
-                self.text = str_sub + " ".join([self.operator.value] + ["("+Content._strip_subject(c.text) + ")" if c.subject is self.subject else "("+c.text+")" for c in self.content_list])
-            elif self.operator is Operator.NOT:
-                self.text = str_sub + " ".join([self.operator.value, "("+Content._strip_subject(self.content_list[0].text) +
-                                                ")" if self.content_list[0].subject is self.subject else "("+self.content_list[0].text+")"])
-            elif self.operator is Operator.DAY:
-                self.text = str_sub + " ".join([self.operator.value, str(self.day), "("+Content._strip_subject(self.content_list[0].text) +
-                                                ")" if self.content_list[0].subject is self.subject else "("+self.content_list[0].text+")"])
+            return
+        for c in operands:
+            parts.append(" (")
+            if c.subject is not subject and c._text is not None:
+                parts.append(c._text)
+            else:
+                c._write_text(parts, c.subject is not subject)
+            parts.append(")")
+
+    @property
+    def utterance(self) -> Utterance:
+        """The utterance this Content refers to, of which only the type, the date and the index number are known.
+
+        A new copy is returned on each access, so modifying it does not affect this Content.
+        GameInfo.get_utterance finds the actual one."""
+        cls, day, agent, idx, text, turn = self._utterance
+        return cls(day, agent, idx, text, turn)
+
+    @property
+    def text(self) -> str:
+        """The text representing this Content, which is built on the first access."""
+        text: Optional[str] = self._text
+        if text is None:
+            parts: list[str] = []
+            self._write_text(parts, True)
+            text = "".join(parts)
+            object.__setattr__(self, "_text", text)
+        return text
 
     _strip_pattern: ClassVar[Pattern[str]] = re.compile(r"^(Agent\[\d+\]|ANY|)\s*([A-Z]+.*)$")
 
@@ -160,96 +206,85 @@ class Content:
     def clone(self) -> Content:
         """Clone this Content.
 
+        Since Content is immutable, this Content itself is returned.
+
         Returns:
             The cloned Content.
         """
-        content: Content = copy.copy(self)
-        content.utterance = copy.copy(self.utterance)
-        content.content_list = [c.clone() for c in self.content_list]
-        return content
+        return self
+
+    def __copy__(self) -> Content:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> Content:
+        return self
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot assign to '{name}' of immutable Content")
 
-    _regex_agent: ClassVar[str] = r"\s+(Agent\[\d+\]|ANY)"
-    _regex_subject: ClassVar[str] = r"^(Agent\[\d+\]|ANY|)\s*"
-    _regex_talk: ClassVar[str] = r"\s+([A-Z]+)\s+day(\d+)\s+ID:(\d+)"
-    _regex_role_species: ClassVar[str] = r"\s+([A-Z]+)"
-    _regex_paren: ClassVar[str] = r"(\(.*\))"
-    _regex_digit: ClassVar[str] = r"(\d+)"
-    _agree_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + "(AGREE|DISAGREE)" + _regex_talk + "$")
-    _estimate_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + "(ESTIMATE|COMINGOUT)" + _regex_agent + _regex_role_species + "$")
-    _divined_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + "(DIVINED|IDENTIFIED)" + _regex_agent + _regex_role_species + "$")
-    _attack_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + "(ATTACK|ATTACKED|DIVINATION|GUARD|GUARDED|VOTE|VOTED)" + _regex_agent + "$")
-    _request_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + "(REQUEST|INQUIRE)" + _regex_agent + r"\s+" + _regex_paren + "$")
-    _because_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + r"(BECAUSE|AND|OR|XOR|NOT|REQUEST)\s+" + _regex_paren + "$")
-    _day_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + r"DAY\s+" + _regex_digit + r"\s+" + _regex_paren + "$")
-    _skip_pattern: ClassVar[Pattern[str]] = re.compile("^(Skip|Over)$")
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete '{name}' of immutable Content")
 
     @staticmethod
     def compile(text: str) -> Content:
         """Convert the uttered text into a Content.
 
+        The malformed part of the text is read as Skip, and the whole text is read as Skip if it is malformed at the top level.
+
         Args:
             text: The uttered text.
 
         Returns:
             The Content converted from the given text.
         """
-        trimmed: str = text.strip()
-        m_agree: Optional[Match[str]] = Content._agree_pattern.match(trimmed)
-        m_estimate: Optional[Match[str]] = Content._estimate_pattern.match(trimmed)
-        m_divined: Optional[Match[str]] = Content._divined_pattern.match(trimmed)
-        m_attack: Optional[Match[str]] = Content._attack_pattern.match(trimmed)
-        m_request: Optional[Match[str]] = Content._request_pattern.match(trimmed)
-        m_because: Optional[Match[str]] = Content._because_pattern.match(trimmed)
-        m_day: Optional[Match[str]] = Content._day_pattern.match(trimmed)
-        m_skip: Optional[Match[str]] = Content._skip_pattern.match(trimmed)
-        content: Content = Content(SkipContentBuilder())
-        if m_skip:
-            content.topic = Topic[m_skip.group(1)]
-        elif m_agree:
-            content.subject = Agent.compile(m_agree.group(1))
-            content.topic = Topic[m_agree.group(2)]
-            if UtteranceType[m_agree.group(3)] is UtteranceType.TALK:
-                content.utterance = Talk(int(m_agree.group(5)), AGENT_NONE, int(m_agree.group(4)), "", 0)
-            else:
-                content.utterance = Whisper(int(m_agree.group(5)), AGENT_NONE, int(m_agree.group(4)), "", 0)
-        elif m_estimate:
-            content.subject = Agent.compile(m_estimate.group(1))
-            content.topic = Topic[m_estimate.group(2)]
-            content.target = Agent.compile(m_estimate.group(3))
-            content.role = Role[m_estimate.group(4)]
-        elif m_divined:
-            content.subject = Agent.compile(m_divined.group(1))
-            content.topic = Topic[m_divined.group(2)]
-            content.target = Agent.compile(m_divined.group(3))
-            content.result = Species[m_divined.group(4)]
-        elif m_attack:
-            content.subject = Agent.compile(m_attack.group(1))
-            content.topic = Topic[m_attack.group(2)]
-            content.target = Agent.compile(m_attack.group(3))
-        elif m_request:
-            content.topic = Topic.OPERATOR
-            content.subject = Agent.compile(m_request.group(1))
-            content.operator = Operator[m_request.group(2)]
-            content.target = Agent.compile(m_request.group(3))
-            content.content_list = Content._get_contents(m_request.group(4))
-        elif m_because:
-            content.topic = Topic.OPERATOR
-            content.subject = Agent.compile(m_because.group(1))
-            content.operator = Operator[m_because.group(2)]
-            content.content_list = Content._get_contents(m_because.group(3))
-            if content.operator is Operator.REQUEST:
-                content.target = AGENT_ANY if content.content_list[0].subject is AGENT_UNSPEC else content.content_list[0].subject
-        elif m_day:
-            content.topic = Topic.OPERATOR
-            content.subject = Agent.compile(m_day.group(1))
-            content.operator = Operator.DAY
-            content.day = int(m_day.group(2))
-            content.content_list = Content._get_contents(m_day.group(3))
-        else:
-            content.topic = Topic.Skip
-        content._complete_inner_subject()
-        content._normalize_text()
-        return content
+        return _ContentParser(text, False).parse()
+
+    @staticmethod
+    def parse(text: str) -> Content:
+        """Convert the uttered text into a Content, rejecting the text that does not follow the protocol.
+
+        Args:
+            text: The uttered text.
+
+        Returns:
+            The Content converted from the given text.
+
+        Raises:
+            ContentSyntaxError: In case of the malformed text, ContentSyntaxError is raised with the position of the error.
+        """
+        return _ContentParser(text, True).parse()
+
+    @staticmethod
+    def compile_many(texts: Iterable[str], processes: Optional[int] = 1, chunksize: int = 1024) -> Iterator[Content]:
+        """Convert the uttered texts into Contents one after another.
+
+        The texts are read in chunks, and each distinct text in a chunk is compiled only once.
+        With more than one process, the chunks are compiled by a pool of worker processes.
+
+        Args:
+            texts: The uttered texts.
+            processes(optional): The number of worker processes. Defaults to 1, which compiles the texts in this process.
+                None means the number of CPUs.
+            chunksize(optional): The number of texts in a chunk. Defaults to 1024.
+
+        Returns:
+            The iterator of the Contents converted from the given texts in the same order.
+
+        Raises:
+            ValueError: In case of non-positive processes or chunksize, ValueError is raised.
+        """
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if processes <= 0 or chunksize <= 0:
+            raise ValueError("Invalid argument: processes and chunksize must be positive")
+        if processes == 1:
+            return (c for chunk in _chunks(texts, chunksize) for c in _ordered(chunk, _compile_list(list(dict.fromkeys(chunk)))))
+        return _compile_pool(texts, processes, chunksize)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Unpickled Contents are interned in the receiving process as well.
+        return (Content._create, (self.topic, self.subject, self.target, self.role, self.result, self._utterance,
+                                  self.operator, self.content_list, self.day, self._raw_text))
 
     def equals(self, other: Content) -> bool:
         """Show whether or not the given Content is equivalent to this Content.
@@ -267,6 +302,103 @@ class Content:
             return NotImplemented
         return self is __o or self.text == __o.text
 
+    def __hash__(self) -> int:
+        return hash(self.text)
+
+
+def _chunks(texts: Iterable[str], chunksize: int) -> Iterator[list[str]]:
+    chunk: list[str] = []
+    for text in texts:
+        chunk.append(text)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _compile_list(texts: list[str]) -> list[Content]:
+    return [Content.compile(text) for text in texts]
+
+
+def _ordered(chunk: list[str], contents: list[Content]) -> Iterator[Content]:
+    # contents holds the Contents of the distinct texts in chunk in the order of their first appearance.
+    content_map: dict[str, Content] = dict(zip(dict.fromkeys(chunk), contents))
+    return (content_map[text] for text in chunk)
+
+
+def _compile_pool(texts: Iterable[str], processes: int, chunksize: int) -> Iterator[Content]:
+    # At most two chunks per worker are in flight, so that the texts are read no faster than they are compiled.
+    pending: deque[tuple[list[str], AsyncResult[list[Content]]]] = deque()
+    with multiprocessing.Pool(processes) as pool:
+        for chunk in _chunks(texts, chunksize):
+            pending.append((chunk, pool.apply_async(_compile_list, (list(dict.fromkeys(chunk)),))))
+            if len(pending) >= 2 * processes:
+                chunk, result = pending.popleft()
+                yield from _ordered(chunk, result.get())
+        while pending:
+            chunk, result = pending.popleft()
+            yield from _ordered(chunk, result.get())
+
+
+class ContentCache:
+    """Memoizing front end of Content.compile that keeps the results for the most recently used texts.
+
+    The Contents returned are shared among the callers, which is safe since Content is immutable.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize a new instance of ContentCache.
+
+        Args:
+            maxsize(optional): The maximum number of the cached Contents. Defaults to 1024.
+
+        Raises:
+            ValueError: In case of non-positive maxsize, ValueError is raised.
+        """
+        if maxsize <= 0:
+            raise ValueError("Invalid argument: maxsize must be positive")
+        self.maxsize: int = maxsize
+        """The maximum number of the cached Contents."""
+
+        self.hits: int = 0
+        """The number of calls answered from the cache."""
+
+        self.misses: int = 0
+        """The number of calls that compiled the text."""
+
+        self._cache: OrderedDict[str, Content] = OrderedDict()
+
+    def compile(self, text: str) -> Content:
+        """Convert the uttered text into a Content, reusing the cached one if any.
+
+        Args:
+            text: The uttered text.
+
+        Returns:
+            The Content converted from the given text.
+        """
+        content: Optional[Content] = self._cache.get(text)
+        if content is not None:
+            self._cache.move_to_end(text)
+            self.hits += 1
+            return content
+        self.misses += 1
+        content = Content.compile(text)
+        self._cache[text] = content
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return content
+
+    def clear(self) -> None:
+        """Remove all the cached Contents and reset the counters."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
 
 class Topic(Enum):
     """Enumeration type for topic."""
@@ -357,8 +489,270 @@ class Operator(Enum):
     """Exclusive disjunctive clause."""
 
 
+class ContentSyntaxError(ValueError):
+    """Exception raised when the text does not follow the grammar of the protocol."""
+
+    def __init__(self, message: str, text: str, position: int) -> None:
+        """Initialize a new instance of ContentSyntaxError.
+
+        Args:
+            message: The description of the error.
+            text: The text being parsed.
+            position: The index in the text where the error was found.
+        """
+        super().__init__(f"{message} at position {position}: {text!r}")
+        self.text: str = text
+        """The text being parsed."""
+
+        self.position: int = position
+        """The index in the text where the error was found."""
+
+
+class _ContentParser:
+    """Recursive-descent parser of the uttered text, which reads each character of the text once.
+
+    In lenient mode, a malformed operand is read as Skip and parsing resumes at its closing parenthesis,
+    and the characters between the operands are ignored, as the pattern-based parser used to do.
+    """
+
+    _head_pattern: ClassVar[Pattern[str]] = re.compile(r"\s*(?:Agent\[(\d+)\]|(ANY))?\s*([A-Za-z]*)")
+    _agree_pattern: ClassVar[Pattern[str]] = re.compile(r"\s+([A-Z]+)\s+day(\d+)\s+ID:(\d+)\s*")
+    _role_pattern: ClassVar[Pattern[str]] = re.compile(r"\s+(?:Agent\[(\d+)\]|(ANY))\s+([A-Z]+)\s*")
+    _target_pattern: ClassVar[Pattern[str]] = re.compile(r"\s+(?:Agent\[(\d+)\]|(ANY))\s*")
+    _request_pattern: ClassVar[Pattern[str]] = re.compile(r"\s+(?:Agent\[(\d+)\]|(ANY))\s+(?=\()")
+    _operator_pattern: ClassVar[Pattern[str]] = re.compile(r"\s+(?=\()")
+    _day_pattern: ClassVar[Pattern[str]] = re.compile(r"\s+(\d+)\s+(?=\()")
+    _space_pattern: ClassVar[Pattern[str]] = re.compile(r"\s*")
+    _paren_pattern: ClassVar[Pattern[str]] = re.compile(r"[()]")
+    _keyword_map: ClassVar[dict[str, Topic | Operator]] = {
+        **{t.value: t for t in Topic if t is not Topic.DUMMY and t is not Topic.OPERATOR and t is not Topic.RAW},
+        **{o.value: o for o in Operator if o is not Operator.NOP},
+    }
+    _no_utterance: ClassVar[_UtteranceKey] = _utterance_key(Utterance())
+
+    def __init__(self, text: str, strict: bool) -> None:
+        self.text: str = text
+        self.strict: bool = strict
+        self.end: int = len(text.rstrip())
+        self.pos: int = 0
+
+    def _error(self, message: str, position: int) -> ContentSyntaxError:
+        return ContentSyntaxError(message, self.text, position)
+
+    def _create(self, topic: Topic, subject: Agent, target: Agent = AGENT_ANY, role: Role = Role.UNC, result: Species = Species.UNC,
+                utterance: Optional[_UtteranceKey] = None, operator: Operator = Operator.NOP, content_list: Sequence[Content] = (),
+                day: int = -1) -> Content:
+        return Content._create(topic, subject, target, role, result, utterance or _ContentParser._no_utterance,
+                               operator, content_list, day, "")
+
+    def parse(self) -> Content:
+        """Parse the whole text.
+
+        Returns:
+            The Content converted from the text.
+        """
+        try:
+            return self._content(AGENT_UNSPEC, False)
+        except ContentSyntaxError:
+            if self.strict:
+                raise
+            return self._create(Topic.Skip, AGENT_UNSPEC)
+
+    def _match(self, pattern: Pattern[str], nested: bool) -> Match[str]:
+        # Match the pattern at the current position, which must be followed by the end of the content.
+        m: Optional[Match[str]] = pattern.match(self.text, self.pos, self.end)
+        if m is None:
+            raise self._malformed_arguments()
+        self.pos = m.end()
+        if not self._at_end(nested):
+            raise self._error("closing parenthesis expected" if nested and self.pos >= self.end else "end of content expected", self.pos)
+        return m
+
+    def _malformed_arguments(self) -> ContentSyntaxError:
+        m: Optional[Match[str]] = _ContentParser._space_pattern.match(self.text, self.pos, self.end)
+        return self._error("malformed arguments", m.end() if m is not None else self.pos)
+
+    def _at_end(self, nested: bool) -> bool:
+        if nested:
+            return self.pos < self.end and self.text[self.pos] == ")"
+        return self.pos >= self.end
+
+    @staticmethod
+    def _agent(idx: Optional[str]) -> Agent:
+        return Agent(int(idx)) if idx is not None else AGENT_ANY
+
+    def _content(self, default_subject: Agent, nested: bool) -> Content:
+        # Parse the content from the current position up to the end of the text, or the closing parenthesis if nested.
+        head: Optional[Match[str]] = _ContentParser._head_pattern.match(self.text, self.pos, self.end)
+        keyword: Optional[Topic | Operator] = _ContentParser._keyword_map.get(head.group(3)) if head is not None else None
+        if head is None or keyword is None:
+            raise self._error("unknown keyword", head.start(3) if head is not None else self.pos)
+        self.pos = head.end()
+        subject: Agent = AGENT_ANY if head.group(2) is not None else Agent(int(head.group(1))) if head.group(1) is not None else AGENT_UNSPEC
+        if subject is AGENT_UNSPEC:
+            subject = default_subject
+        if keyword is Topic.Skip or keyword is Topic.Over:
+            if head.group(1) is not None or head.group(2) is not None:
+                raise self._error("subject not allowed", head.start(3))
+            self._match(_ContentParser._space_pattern, nested)
+            return self._create(keyword, subject)
+        m: Match[str]
+        if keyword is Topic.AGREE or keyword is Topic.DISAGREE:
+            m = self._match(_ContentParser._agree_pattern, nested)
+            if m.group(1) == UtteranceType.TALK.value:
+                return self._create(keyword, subject, utterance=(Talk, int(m.group(2)), AGENT_NONE, int(m.group(3)), "", 0))
+            if m.group(1) == UtteranceType.WHISPER.value:
+                return self._create(keyword, subject, utterance=(Whisper, int(m.group(2)), AGENT_NONE, int(m.group(3)), "", 0))
+            raise self._error("unknown utterance type", m.start(1))
+        if keyword is Topic.ESTIMATE or keyword is Topic.COMINGOUT:
+            m = self._match(_ContentParser._role_pattern, nested)
+            role: Optional[Role] = Role.__members__.get(m.group(3))
+            if role is None:
+                raise self._error("unknown role", m.start(3))
+            return self._create(keyword, subject, self._agent(m.group(1)), role=role)
+        if keyword is Topic.DIVINED or keyword is Topic.IDENTIFIED:
+            m = self._match(_ContentParser._role_pattern, nested)
+            result: Optional[Species] = Species.__members__.get(m.group(3))
+            if result is None:
+                raise self._error("unknown species", m.start(3))
+            return self._create(keyword, subject, self._agent(m.group(1)), result=result)
+        if isinstance(keyword, Topic):
+            m = self._match(_ContentParser._target_pattern, nested)
+            return self._create(keyword, subject, self._agent(m.group(1)))
+        operator: Operator = keyword
+        target: Agent = AGENT_ANY
+        day: int = -1
+        operand_min: int = 2 if operator is Operator.BECAUSE or operator is Operator.XOR else 1
+        operand_max: int = operand_min
+        if operator is Operator.AND or operator is Operator.OR:
+            # AND and OR take any number of operands, though at least one is required in strict mode.
+            operand_min = 1 if self.strict else 0
+            operand_max = 0
+        m_op: Optional[Match[str]] = None
+        if operator is Operator.REQUEST:
+            m_op = _ContentParser._operator_pattern.match(self.text, self.pos, self.end)
+        if m_op is not None:
+            # REQUEST without the target, which is the subject of the requested action.
+            self.pos = m_op.end()
+            operands: list[Content] = self._operands(AGENT_ANY, nested, True)
+            target = operands[0].subject if operands else AGENT_ANY
+        else:
+            if operator is Operator.REQUEST or operator is Operator.INQUIRE:
+                m_op = _ContentParser._request_pattern.match(self.text, self.pos, self.end)
+            elif operator is Operator.DAY:
+                m_op = _ContentParser._day_pattern.match(self.text, self.pos, self.end)
+            else:
+                m_op = _ContentParser._operator_pattern.match(self.text, self.pos, self.end)
+            if m_op is None:
+                raise self._malformed_arguments()
+            self.pos = m_op.end()
+            if operator is Operator.REQUEST or operator is Operator.INQUIRE:
+                target = self._agent(m_op.group(1))
+                subject_operand: Agent = target
+            else:
+                if operator is Operator.DAY:
+                    day = int(m_op.group(1))
+                subject_operand = subject
+            operands = self._operands(subject_operand, nested, False)
+        if len(operands) < operand_min or (self.strict and 0 < operand_max < len(operands)):
+            raise self._error("wrong number of operands", self.pos)
+        return self._create(Topic.OPERATOR, subject, target, operator=operator, content_list=operands, day=day)
+
+    def _operands(self, subject: Agent, nested: bool, request: bool) -> list[Content]:
+        # Parse the parenthesized operands from the current position up to the end of the text, or the closing parenthesis if nested.
+        text: str = self.text
+        end: int = self.end
+        pos: int = self.pos
+        if not nested:
+            newline: int = text.find("\n", pos, end)
+            if newline >= 0:
+                raise self._error("line break in operands", newline)
+        operands: list[Content] = []
+        depth: int = 0
+        closed: bool = False
+        while True:
+            m: Optional[Match[str]] = _ContentParser._paren_pattern.search(text, pos, end)
+            stop: int = m.start() if m is not None else end
+            if pos < stop and not text[pos:stop].isspace():
+                if self.strict:
+                    raise self._error("operand expected", pos + len(text[pos:stop]) - len(text[pos:stop].lstrip()))
+                closed = False
+            if m is None:
+                pos = end
+                break
+            if text[stop] == "(":
+                if depth == 0:
+                    self.pos = stop + 1
+                    operand: Optional[Content] = self._operand(subject)
+                    if operand is None:
+                        pos = end
+                        closed = text[end - 1] == ")"
+                        break
+                    operands.append(operand)
+                    if request and len(operands) == 1:
+                        subject = operand.subject
+                    closed = True
+                    pos = self.pos
+                else:
+                    depth += 1
+                    closed = False
+                    pos = stop + 1
+            elif nested and depth == 0:
+                pos = stop
+                break
+            else:
+                if self.strict:
+                    raise self._error("unbalanced parenthesis", stop)
+                depth -= 1
+                closed = True
+                pos = stop + 1
+        self.pos = pos
+        if not closed:
+            raise self._error("operand expected", pos)
+        return operands
+
+    def _operand(self, subject: Agent) -> Optional[Content]:
+        # Parse the operand following the opening parenthesis, and return None if it is not closed.
+        content: Content
+        try:
+            content = self._content(subject, True)
+        except ContentSyntaxError as e:
+            if self.strict:
+                raise
+            self.pos = e.position
+            if not self._skip_operand():
+                return None
+            content = self._create(Topic.Skip, subject)
+        if self.pos >= self.end:
+            if self.strict:
+                raise self._error("closing parenthesis expected", self.pos)
+            return None
+        self.pos += 1
+        return content
+
+    def _skip_operand(self) -> bool:
+        # Move to the closing parenthesis of the malformed operand, and return False if it is not closed.
+        depth: int = 0
+        while True:
+            m: Optional[Match[str]] = _ContentParser._paren_pattern.search(self.text, self.pos, self.end)
+            if m is None:
+                self.pos = self.end
+                return False
+            self.pos = m.start()
+            if m.group() == "(":
+                depth += 1
+            elif depth == 0:
+                return True
+            else:
+                depth -= 1
+            self.pos += 1
+
+
 class ContentBuilder:
-    """A class for the builder classes to build Content of all kinds."""
+    """A class for the builder classes to build Content of all kinds.
+
+    The operands given to the builders are shared by the built Content without being copied, since Content is immutable.
+    """
 
     def __init__(self) -> None:
         """Initialize a new instance of ContentBuilder."""
@@ -593,7 +987,7 @@ class RequestContentBuilder(ContentBuilder):
         self._operator = Operator.REQUEST
         self._subject = subject
         self._target = target
-        self._content_list.append(action.clone())
+        self._content_list.append(action)
 
 
 class InquiryContentBuilder(RequestContentBuilder):
@@ -626,8 +1020,8 @@ class BecauseContentBuilder(ContentBuilder):
         self._topic = Topic.OPERATOR
         self._operator = Operator.BECAUSE
         self._subject = subject
-        self._content_list.append(reason.clone())
-        self._content_list.append(action.clone())
+        self._content_list.append(reason)
+        self._content_list.append(action)
 
 
 class AndContentBuilder(ContentBuilder):
@@ -649,7 +1043,7 @@ class AndContentBuilder(ContentBuilder):
         self._subject = subject
         if not contents:
             raise ValueError("Invalid argument: contents is empty")
-        self._content_list.extend([c.clone() for c in contents])
+        self._content_list.extend(contents)
 
 
 class OrContentBuilder(AndContentBuilder):
@@ -695,7 +1089,7 @@ class NotContentBuilder(ContentBuilder):
         self._topic = Topic.OPERATOR
         self._operator = Operator.NOT
         self._subject = subject
-        self._content_list.append(content.clone())
+        self._content_list.append(content)
 
 
 class DayContentBuilder(ContentBuilder):
@@ -714,7 +1108,7 @@ class DayContentBuilder(ContentBuilder):
         self._operator = Operator.DAY
         self._subject = subject
         self._day = day
-        self._content_list.append(content.clone())
+        self._content_list.append(content)
 
 
 class SkipContentBuilder(ContentBuilder):
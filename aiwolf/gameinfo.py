@@ -15,13 +15,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """gameinfo module."""
-from typing import Optional, TypedDict
+from typing import Any, Callable, ClassVar, Mapping, Optional, TypedDict, TypeVar
 
 from aiwolf.agent import Agent, Role, Status
+from aiwolf.agentset import AgentSet
+from aiwolf.content import Content
 from aiwolf.judge import Judge, _Judge
-from aiwolf.utterance import Talk, Whisper, _Utterance
+from aiwolf.utterance import Talk, Utterance, UtteranceLog, Whisper, _Utterance
 from aiwolf.vote import Vote, _Vote
 
+_U = TypeVar("_U", bound=Utterance)
+
 
 class _GameInfo(TypedDict):
     agent: int
@@ -50,16 +54,18 @@ class _GameInfo(TypedDict):
 class GameInfo:
     """Class for game information."""
 
-    def __init__(self, game_info: _GameInfo) -> None:
+    def __init__(self, game_info: _GameInfo, talk_log: Optional[UtteranceLog[Talk]] = None, whisper_log: Optional[UtteranceLog[Whisper]] = None) -> None:
         """Initializes a new instance of GameInfo.
 
         Args:
             game_info: The _GameInfo used for initialization.
+            talk_log(optional): The log of the talks in this game. Defaults to a new log.
+            whisper_log(optional): The log of the whispers in this game. Defaults to a new log.
         """
         self.me: Agent = Agent(game_info["agent"])
         """The agent who recieves this GameInfo."""
 
-        self.attack_vote_list: list[Vote] = [Vote.compile(v) for v in game_info["attackVoteList"]]
+        self.attack_vote_list: list[Vote] = GameInfo._get_vote_list(game_info["attackVoteList"])
         """The list of votes for attack."""
 
         self.attacked_agent: Optional[Agent] = GameInfo._get_agent(game_info["attackedAgent"])
@@ -71,58 +77,135 @@ class GameInfo:
         self.day: int = game_info["day"]
         """Current day."""
 
-        self.divine_result: Optional[Judge] = Judge.compile(game_info["divineResult"]) if game_info["divineResult"] is not None else None
+        self.divine_result: Optional[Judge] = GameInfo._get_judge(game_info["divineResult"])
         """The result of the dvination."""
 
         self.executed_agent: Optional[Agent] = GameInfo._get_agent(game_info["executedAgent"])
         """The agent executed last night."""
 
-        self.existing_role_list: list[Role] = [Role[r] for r in game_info["existingRoleList"]]
+        self.existing_role_list: list[Role] = GameInfo._get_role_list(game_info["existingRoleList"])
         """The list of existing roles in this game."""
 
         self.guarded_agent: Optional[Agent] = GameInfo._get_agent(game_info["guardedAgent"])
         """The agent guarded last night."""
 
-        self.last_dead_agent_list: list[Agent] = [Agent(a) for a in game_info["lastDeadAgentList"]]
+        self.last_dead_agent_list: list[Agent] = GameInfo._get_agent_list(game_info["lastDeadAgentList"])
         """The list of agents who died last night."""
 
-        self.latest_attack_vote_list: list[Vote] = [Vote.compile(v) for v in game_info["latestAttackVoteList"]]
+        self.latest_attack_vote_list: list[Vote] = GameInfo._get_vote_list(game_info["latestAttackVoteList"])
         """The latest list of votes for attack."""
 
         self.latest_executed_agent: Optional[Agent] = GameInfo._get_agent(game_info["latestExecutedAgent"])
         """The latest executed agent."""
 
-        self.latest_vote_list: list[Vote] = [Vote.compile(v) for v in game_info["latestVoteList"]]
+        self.latest_vote_list: list[Vote] = GameInfo._get_vote_list(game_info["latestVoteList"])
         """The latest list of votes for execution."""
 
-        self.medium_result: Optional[Judge] = Judge.compile(game_info["mediumResult"]) if game_info["mediumResult"] is not None else None
+        self.medium_result: Optional[Judge] = GameInfo._get_judge(game_info["mediumResult"])
         """The result of the inquest."""
 
-        self.remain_talk_map: dict[Agent, int] = {Agent(int(k)): v for k, v in game_info["remainTalkMap"].items()}
+        self.remain_talk_map: dict[Agent, int] = GameInfo._get_int_map(game_info["remainTalkMap"])
         """The number of opportunities to talk remaining."""
 
-        self.remain_whisper_map: dict[Agent, int] = {Agent(int(k)): v for k, v in game_info["remainWhisperMap"].items()}
+        self.remain_whisper_map: dict[Agent, int] = GameInfo._get_int_map(game_info["remainWhisperMap"])
         """The number of opportunities to whisper remaining."""
 
-        self.role_map: dict[Agent, Role] = {Agent(int(k)): Role[v] for k, v in game_info["roleMap"].items()}
+        self.role_map: dict[Agent, Role] = GameInfo._get_role_map(game_info["roleMap"])
         """The known roles of agents."""
 
-        self.status_map: dict[Agent, Status] = {Agent(int(k)): Status[v] for k, v in game_info["statusMap"].items()}
+        self.status_map: dict[Agent, Status] = GameInfo._get_status_map(game_info["statusMap"])
         """The statuses of all agents."""
 
-        self.talk_list: list[Talk] = [Talk.compile(u) for u in game_info["talkList"]]
+        self.talk_log: UtteranceLog[Talk] = talk_log if talk_log is not None else UtteranceLog(Talk.compile)
+        """The log of the talks in this game, in which each talk is compiled only once."""
+
+        self.whisper_log: UtteranceLog[Whisper] = whisper_log if whisper_log is not None else UtteranceLog(Whisper.compile)
+        """The log of the whispers in this game, in which each whisper is compiled only once."""
+
+        self.talk_list: list[Talk] = [self.talk_log.add(u) for u in game_info["talkList"]]
         """The list of today's talks."""
 
-        self.vote_list: list[Vote] = [Vote.compile(v) for v in game_info["voteList"]]
+        self.vote_list: list[Vote] = GameInfo._get_vote_list(game_info["voteList"])
         """The list of votes for execution."""
 
-        self.whisper_list: list[Whisper] = [Whisper.compile(u) for u in game_info["whisperList"]]
+        self.whisper_list: list[Whisper] = [self.whisper_log.add(u) for u in game_info["whisperList"]]
         """The list of today's whispers."""
 
+        self.updated_fields: set[str] = {name for name, _ in GameInfo._fields.values()} | {"talk_list", "whisper_list"}
+        """The names of the attributes changed by the last update."""
+
+        self._game_info: _GameInfo = game_info
+        self._status_sets: Optional[tuple[AgentSet, AgentSet]] = None
+
+    _fields: ClassVar[dict[str, tuple[str, Callable[[Any], Any]]]]
+
     @staticmethod
     def _get_agent(idx: int) -> Optional[Agent]:
         return None if idx < 0 else Agent(idx)
 
+    @staticmethod
+    def _get_agent_list(idx_list: list[int]) -> list[Agent]:
+        return [Agent(a) for a in idx_list]
+
+    @staticmethod
+    def _get_vote_list(vote_list: list[_Vote]) -> list[Vote]:
+        return [Vote.compile(v) for v in vote_list]
+
+    @staticmethod
+    def _get_judge(judge: Optional[_Judge]) -> Optional[Judge]:
+        return Judge.compile(judge) if judge is not None else None
+
+    @staticmethod
+    def _get_role_list(role_list: list[str]) -> list[Role]:
+        return [Role[r] for r in role_list]
+
+    @staticmethod
+    def _get_int_map(int_map: dict[str, int]) -> dict[Agent, int]:
+        return {Agent(int(k)): v for k, v in int_map.items()}
+
+    @staticmethod
+    def _get_role_map(role_map: dict[str, str]) -> dict[Agent, Role]:
+        return {Agent(int(k)): Role[v] for k, v in role_map.items()}
+
+    @staticmethod
+    def _get_status_map(status_map: dict[str, str]) -> dict[Agent, Status]:
+        return {Agent(int(k)): Status[v] for k, v in status_map.items()}
+
+    @staticmethod
+    def _merge_utterances(utterance_list: list[_U], utterance_list0: list[_Utterance], compile: Callable[[_Utterance], _U]) -> bool:
+        known: int = len(utterance_list)
+        if known > len(utterance_list0) \
+                or known > 0 and (utterance_list[-1].day, utterance_list[-1].idx) != (utterance_list0[known-1]["day"], utterance_list0[known-1]["idx"]):
+            utterance_list[:] = [compile(u) for u in utterance_list0]
+            return True
+        utterance_list.extend(compile(u) for u in utterance_list0[known:])
+        return known < len(utterance_list0)
+
+    def update(self, game_info: _GameInfo) -> None:
+        """Apply the newly received _GameInfo to this GameInfo.
+
+        Only the attributes whose source data have changed are rebuilt, and today's talks and whispers
+        already known are kept as they are. The names of the changed attributes are stored in updated_fields.
+
+        Args:
+            game_info: The _GameInfo of the same game received after the one this GameInfo reflects.
+        """
+        last: Mapping[str, object] = self._game_info
+        new: Mapping[str, object] = game_info
+        updated: set[str] = set()
+        for key, (name, convert) in GameInfo._fields.items():
+            if new[key] != last[key]:
+                setattr(self, name, convert(new[key]))
+                updated.add(name)
+        if GameInfo._merge_utterances(self.talk_list, game_info["talkList"], self.talk_log.add):
+            updated.add("talk_list")
+        if GameInfo._merge_utterances(self.whisper_list, game_info["whisperList"], self.whisper_log.add):
+            updated.add("whisper_list")
+        self.updated_fields = updated
+        self._game_info = game_info
+        if "status_map" in updated:
+            self._status_sets = None
+
     @property
     def agent_list(self) -> list[Agent]:
         """The list of existing agents."""
@@ -133,7 +216,63 @@ class GameInfo:
         """The list of alive agents."""
         return [i[0] for i in self.status_map.items() if i[1] == Status.ALIVE]
 
+    def _get_status_sets(self) -> tuple[AgentSet, AgentSet]:
+        if self._status_sets is None:
+            self._status_sets = (AgentSet(a for a, s in self.status_map.items() if s == Status.ALIVE),
+                                 AgentSet(a for a, s in self.status_map.items() if s == Status.DEAD))
+        return self._status_sets
+
+    @property
+    def alive_agent_set(self) -> AgentSet:
+        """The set of alive agents, which is built only once for each status_map received."""
+        return self._get_status_sets()[0]
+
+    @property
+    def dead_agent_set(self) -> AgentSet:
+        """The set of dead agents, which is built only once for each status_map received."""
+        return self._get_status_sets()[1]
+
     @property
     def my_role(self) -> Role:
         """The role of the player who receives this GameInfo."""
         return self.role_map[self.me]
+
+    def get_utterance(self, content: Content) -> Optional[Utterance]:
+        """Return the talk or the whisper the AGREE/DISAGREE Content refers to.
+
+        Args:
+            content: The Content referring to the utterance.
+
+        Returns:
+            The utterance in talk_log or whisper_log with the date and the index number of content.utterance,
+            or None if it is not known.
+        """
+        utterance: Utterance = content.utterance
+        if type(utterance) is Talk:
+            return self.talk_log.get(utterance.day, utterance.idx)
+        if type(utterance) is Whisper:
+            return self.whisper_log.get(utterance.day, utterance.idx)
+        return None
+
+
+GameInfo._fields = {
+    "agent": ("me", Agent),
+    "attackVoteList": ("attack_vote_list", GameInfo._get_vote_list),
+    "attackedAgent": ("attacked_agent", GameInfo._get_agent),
+    "cursedFox": ("cursed_fox", GameInfo._get_agent),
+    "day": ("day", int),
+    "divineResult": ("divine_result", GameInfo._get_judge),
+    "executedAgent": ("executed_agent", GameInfo._get_agent),
+    "existingRoleList": ("existing_role_list", GameInfo._get_role_list),
+    "guardedAgent": ("guarded_agent", GameInfo._get_agent),
+    "lastDeadAgentList": ("last_dead_agent_list", GameInfo._get_agent_list),
+    "latestAttackVoteList": ("latest_attack_vote_list", GameInfo._get_vote_list),
+    "latestExecutedAgent": ("latest_executed_agent", GameInfo._get_agent),
+    "latestVoteList": ("latest_vote_list", GameInfo._get_vote_list),
+    "mediumResult": ("medium_result", GameInfo._get_judge),
+    "remainTalkMap": ("remain_talk_map", GameInfo._get_int_map),
+    "remainWhisperMap": ("remain_whisper_map", GameInfo._get_int_map),
+    "roleMap": ("role_map", GameInfo._get_role_map),
+    "statusMap": ("status_map", GameInfo._get_status_map),
+    "voteList": ("vote_list", GameInfo._get_vote_list),
+}
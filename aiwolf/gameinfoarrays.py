@@ -0,0 +1,182 @@
+#
+# gameinfoarrays.py
+#
+# Copyright 2022 OTSUKI Takashi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""gameinfoarrays module."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
+
+from aiwolf.agent import Agent, Role, Status
+from aiwolf.gameinfo import GameInfo
+from aiwolf.vote import Vote
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+
+def require_numpy(user: str) -> Any:
+    """Import NumPy, which is an optional dependency of this package.
+
+    Args:
+        user: The name of the feature that needs NumPy, shown in the error message.
+
+    Returns:
+        The numpy module.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(f"{user} requires NumPy, which is installed by 'pip install aiwolf[numpy]'") from e
+    return numpy
+
+
+class GameInfoArrays:
+    """NumPy array view of GameInfo.
+
+    The arrays are indexed by agent_idx - 1, and are rebuilt only by update,
+    so that the strategy code can read them many times per request without converting GameInfo again.
+    The votes are accumulated through a game, so a new GameInfoArrays should be used for each game.
+    If the same one is reused, it is reset when the date goes backwards or the player changes, or by reset.
+    """
+
+    roles: ClassVar[tuple[Role, ...]] = tuple(Role)
+    """The roles in the order of their codes in role. The role whose code is 0 is Role.UNC."""
+
+    _role_codes: ClassVar[dict[Role, int]] = {r: i for i, r in enumerate(roles)}
+
+    @staticmethod
+    def role_code(role: Role) -> int:
+        """Return the code of the role used in the arrays.
+
+        Args:
+            role: The role.
+
+        Returns:
+            The index of the role in roles.
+        """
+        return GameInfoArrays._role_codes[role]
+
+    def __init__(self, agent_num: int) -> None:
+        """Initialize a new instance of GameInfoArrays.
+
+        Args:
+            agent_num: The number of agents in the game.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        numpy = require_numpy("GameInfoArrays")
+        self.agent_num: int = agent_num
+        """The number of agents in the game."""
+
+        self.day: int = -1
+        """The date of the GameInfo last applied."""
+
+        self.alive: npt.NDArray[np.bool_] = numpy.zeros(agent_num, dtype=numpy.bool_)
+        """The boolean array which is True for the alive agents."""
+
+        self.role: npt.NDArray[np.int8] = numpy.zeros(agent_num, dtype=numpy.int8)
+        """The array of the role codes (indices into roles) of the agents. 0 (Role.UNC) for the agents whose roles are unknown."""
+
+        self.remain_talk: npt.NDArray[np.int16] = numpy.zeros(agent_num, dtype=numpy.int16)
+        """The array of the numbers of the talks each agent can still send today."""
+
+        self.remain_whisper: npt.NDArray[np.int16] = numpy.zeros(agent_num, dtype=numpy.int16)
+        """The array of the numbers of the whispers each agent can still send today."""
+
+        self._votes: npt.NDArray[np.int8] = numpy.zeros((1, agent_num, agent_num), dtype=numpy.int8)
+        self._source_map: dict[str, object] = {}
+        self._me: Optional[Agent] = None
+
+    def reset(self) -> None:
+        """Forget everything applied so far to start a new game."""
+        self.day = -1
+        self.alive[:] = False
+        self.role[:] = 0
+        self.remain_talk[:] = 0
+        self.remain_whisper[:] = 0
+        self._votes[:] = 0
+        self._source_map.clear()
+        self._me = None
+
+    @property
+    def votes(self) -> npt.NDArray[np.int8]:
+        """The day by voter by target array which is 1 where the voter's latest known vote on the day was for the target.
+
+        A revote replaces the votes of the same day, so that every voter has at most one 1 per day.
+        """
+        return self._votes[:self.day + 1]
+
+    def update(self, game_info: GameInfo) -> None:
+        """Rebuild the arrays from the given GameInfo.
+
+        Only the arrays whose source attributes are not the very objects applied last time are rebuilt,
+        which holds both for the incrementally updated GameInfo and for a new one of each request.
+
+        Args:
+            game_info: The GameInfo to be reflected.
+        """
+        numpy = require_numpy("GameInfoArrays")
+        if game_info.day < self.day or self._me is not None and game_info.me is not self._me:
+            self.reset()
+        self._me = game_info.me
+        self.day = game_info.day
+        if self._is_new(game_info, "status_map"):
+            self.alive[:] = False
+            self.alive[self._indices(a for a, s in game_info.status_map.items() if s == Status.ALIVE)] = True
+        if self._is_new(game_info, "role_map"):
+            self.role[:] = 0
+            self.role[self._indices(game_info.role_map.keys())] = [GameInfoArrays._role_codes[r] for r in game_info.role_map.values()]
+        if self._is_new(game_info, "remain_talk_map"):
+            self._fill(self.remain_talk, game_info.remain_talk_map)
+        if self._is_new(game_info, "remain_whisper_map"):
+            self._fill(self.remain_whisper, game_info.remain_whisper_map)
+        if self._votes.shape[0] <= self.day:
+            votes = numpy.zeros((max(self.day + 1, 2 * self._votes.shape[0]), self.agent_num, self.agent_num), dtype=numpy.int8)
+            votes[:self._votes.shape[0]] = self._votes
+            self._votes = votes
+        if self._is_new(game_info, "vote_list"):
+            self._put_votes(game_info.vote_list)
+        if self._is_new(game_info, "latest_vote_list"):
+            self._put_votes(game_info.latest_vote_list)
+
+    def _is_new(self, game_info: GameInfo, name: str) -> bool:
+        source: object = getattr(game_info, name)
+        if self._source_map.get(name) is source:
+            return False
+        self._source_map[name] = source
+        return True
+
+    @staticmethod
+    def _indices(agents: Any) -> list[int]:
+        return [a.agent_idx - 1 for a in agents]
+
+    @staticmethod
+    def _fill(array: npt.NDArray[np.int16], int_map: dict[Agent, int]) -> None:
+        array[:] = 0
+        array[GameInfoArrays._indices(int_map.keys())] = list(int_map.values())
+
+    def _put_votes(self, vote_list: list[Vote]) -> None:
+        if not vote_list:
+            return
+        days: list[int] = [v.day for v in vote_list]
+        voters: list[int] = GameInfoArrays._indices(v.agent for v in vote_list)
+        self._votes[days, voters] = 0
+        self._votes[days, voters, GameInfoArrays._indices(v.target for v in vote_list)] = 1
@@ -33,6 +33,8 @@ class _Judge(TypedDict):
 class Judge:
     """The judgement whether the player is a human or a werewolf."""
 
+    __slots__ = ("agent", "day", "target", "result")
+
     def __init__(self, agent: Agent = AGENT_NONE, day: int = -1, target: Agent = AGENT_NONE, result: Species = Species.UNC) -> None:
         """Initialize a new instance of Judge.
 
@@ -0,0 +1,132 @@
+#
+# launcher.py
+#
+# Copyright 2022 OTSUKI Takashi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""launcher module."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from typing import Callable, Optional
+
+from aiwolf.client import MultiTcpipClient
+from aiwolf.player import AbstractPlayer
+
+PlayerSpec = tuple[Callable[[], AbstractPlayer], Optional[str], str]
+"""The tuple of a picklable factory of a player agent, its name and the name of role it wants to be."""
+
+
+class WorkerStats:
+    """Statistics of a worker process of Launcher."""
+
+    def __init__(self, pid: int, agent_num: int) -> None:
+        """Initialize a new instance of WorkerStats.
+
+        Args:
+            pid: The process ID of the worker.
+            agent_num: The number of player agents the worker serves.
+        """
+        self.pid: int = pid
+        """The process ID of the worker."""
+
+        self.agent_num: int = agent_num
+        """The number of player agents the worker serves."""
+
+        self.packet_num: int = 0
+        """The number of packets received from the server."""
+
+        self.received_bytes: int = 0
+        """The number of bytes received from the server."""
+
+        self.elapsed: float = 0.0
+        """The wall-clock time in seconds the worker took."""
+
+        self.cpu_time: float = 0.0
+        """The CPU time in seconds the worker consumed."""
+
+        self.error: Optional[str] = None
+        """The description of the error that stopped the whole worker, or None if it did not happen."""
+
+        self.agent_error_map: dict[int, str] = {}
+        """The descriptions of the errors that stopped player agents, by the index of the player agent in Launcher.players.
+
+        The other player agents served by the worker are not affected by these errors."""
+
+    @property
+    def exit_status(self) -> int:
+        """0 if the worker and all its player agents finished cleanly, otherwise 1."""
+        return 0 if self.error is None and not self.agent_error_map else 1
+
+    @property
+    def packets_per_second(self) -> float:
+        """The number of packets the worker handled per second."""
+        return self.packet_num / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _run_worker(args: tuple[list[PlayerSpec], list[int], str, int, bool]) -> WorkerStats:
+    specs, indices, host, port, incremental = args
+    stats: WorkerStats = WorkerStats(os.getpid(), len(specs))
+    start: float = time.perf_counter()
+    start_cpu: float = time.process_time()
+    client: Optional[MultiTcpipClient] = None
+    try:
+        client = MultiTcpipClient([(factory(), name, request_role) for factory, name, request_role in specs], host, port, incremental=incremental)
+        client.connect()
+    except Exception as e:
+        stats.error = repr(e)
+    stats.elapsed = time.perf_counter() - start
+    stats.cpu_time = time.process_time() - start_cpu
+    if client is not None:
+        stats.packet_num = sum(c.packet_num for c in client.clients)
+        stats.received_bytes = sum(c.received_bytes for c in client.clients)
+        stats.agent_error_map = {i: e for i, e in zip(indices, client.error_list) if e is not None}
+    return stats
+
+
+class Launcher:
+    """Launcher that spreads many player agents over a pool of worker processes."""
+
+    def __init__(self, players: list[PlayerSpec], host: str, port: int, processes: Optional[int] = None, *, incremental: bool = False) -> None:
+        """Initialize a new instance of Launcher.
+
+        Args:
+            players: The list of the tuples of a picklable factory of a player agent (e.g. the class of the player),
+                its name and the name of role it wants to be.
+            host: The hostname of the server.
+            port: The port number the server is waiting on.
+            processes(optional): The number of worker processes. Defaults to the number of CPUs.
+            incremental(optional): Whether or not one GameInfo is kept through a game and updated in place. Defaults to False.
+        """
+        self.players: list[PlayerSpec] = players
+        self.host: str = host
+        self.port: int = port
+        self.processes: int = processes if processes is not None else os.cpu_count() or 1
+        self.incremental: bool = incremental
+        self.stats: list[WorkerStats] = []
+        """The statistics of each worker process collected by the last launch."""
+
+    def launch(self) -> int:
+        """Connect all the player agents to the server and wait until the server closes every connection.
+
+        Returns:
+            0 if every worker process finished cleanly, otherwise 1.
+        """
+        shard_num: int = max(1, min(self.processes, len(self.players)))
+        shards: list[list[int]] = [list(range(i, len(self.players), shard_num)) for i in range(shard_num)]
+        with multiprocessing.Pool(shard_num) as pool:
+            self.stats = pool.map(_run_worker, [([self.players[i] for i in shard], shard, self.host, self.port, self.incremental) for shard in shards],
+                                  chunksize=1)
+        return max((s.exit_status for s in self.stats), default=0)
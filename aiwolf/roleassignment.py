@@ -0,0 +1,254 @@
+#
+# roleassignment.py
+#
+# Copyright 2022 OTSUKI Takashi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""roleassignment module."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+from aiwolf.agent import Agent, Role, Species
+from aiwolf.gameinfo import GameInfo
+from aiwolf.gameinfoarrays import GameInfoArrays, require_numpy
+from aiwolf.gamesetting import GameSetting
+from aiwolf.judge import Judge
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+
+class RoleAssignment:
+    """The set of the assignments of roles to agents that are consistent with hard constraints.
+
+    The roles allowed for each agent are kept as a bitmask over the role codes (indices into GameInfoArrays.roles).
+    The assignments are counted by dynamic programming over the numbers of the roles remaining,
+    so that they are counted, sampled uniformly and summarized as marginal probabilities without being enumerated.
+    """
+
+    def __init__(self, agent_list: Iterable[Agent], role_num_map: dict[Role, int]) -> None:
+        """Initialize a new instance of RoleAssignment with no constraint.
+
+        Args:
+            agent_list: The agents.
+            role_num_map: The dict mapping each role to the number of the agents of the role.
+
+        Raises:
+            ValueError: If the number of the roles differs from the number of the agents.
+            ImportError: If NumPy is not installed.
+        """
+        numpy = require_numpy("RoleAssignment")
+        self.agent_list: list[Agent] = list(agent_list)
+        """The agents."""
+
+        self.role_num_map: dict[Role, int] = {r: n for r, n in role_num_map.items() if n > 0}
+        """The dict mapping each role to the number of the agents of the role."""
+
+        if sum(self.role_num_map.values()) != len(self.agent_list):
+            raise ValueError("Invalid argument: the number of the roles differs from the number of the agents")
+        self._agent_map: dict[Agent, int] = {a: i for i, a in enumerate(self.agent_list)}
+        self._roles: list[Role] = [r for r in GameInfoArrays.roles if r in self.role_num_map]
+        self._codes: npt.NDArray[np.int8] = numpy.array([GameInfoArrays.role_code(r) for r in self._roles], dtype=numpy.int8)
+        self._all: int = sum(1 << GameInfoArrays.role_code(r) for r in self._roles)
+        self._masks: list[int] = [self._all] * len(self.agent_list)
+        strides: list[int] = []
+        state_num: int = 1
+        for r in self._roles:
+            strides.append(state_num)
+            state_num *= self.role_num_map[r] + 1
+        states: npt.NDArray[np.int64] = numpy.arange(state_num, dtype=numpy.int64)
+        self._strides: npt.NDArray[np.int64] = numpy.array(strides, dtype=numpy.int64)
+        self._full: int = sum(s * self.role_num_map[r] for s, r in zip(strides, self._roles))
+        self._movable: list[npt.NDArray[np.bool_]] = [(states // s) % (self.role_num_map[r] + 1) > 0 for s, r in zip(strides, self._roles)]
+        self._table: Optional[npt.NDArray[np.int64]] = None
+
+    @staticmethod
+    def from_game_info(game_info: GameInfo, game_setting: GameSetting, judge_list: Iterable[Judge] = ()) -> RoleAssignment:
+        """Create a RoleAssignment constrained by what the player knows for sure.
+
+        The roles in role_map of game_info are fixed, the agents that died at night are not werewolves,
+        and the agents judged HUMAN by the given judgements are not werewolves and those judged WEREWOLF are.
+
+        Args:
+            game_info: The GameInfo.
+            game_setting: The GameSetting of the game.
+            judge_list(optional): The results of the player's own divinations and identifications. Defaults to none.
+
+        Returns:
+            The RoleAssignment with the constraints.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        assignment: RoleAssignment = RoleAssignment(sorted(game_info.agent_list, key=lambda a: a.agent_idx),
+                                                    {r: n for r, n in game_setting.role_num_map.items() if r in game_info.existing_role_list})
+        for agent, role in game_info.role_map.items():
+            assignment.fix(agent, role)
+        for agent in game_info.last_dead_agent_list:
+            assignment.exclude(agent, Role.WEREWOLF)
+        for judge in judge_list:
+            if judge.result is Species.HUMAN:
+                assignment.exclude(judge.target, Role.WEREWOLF)
+            elif judge.result is Species.WEREWOLF:
+                assignment.fix(judge.target, Role.WEREWOLF)
+        return assignment
+
+    def fix(self, agent: Agent, role: Role) -> None:
+        """Allow the agent only the given role.
+
+        Args:
+            agent: The agent.
+            role: The role of the agent.
+        """
+        self._set_mask(agent, self._masks[self._agent_map[agent]] & 1 << GameInfoArrays.role_code(role))
+
+    def exclude(self, agent: Agent, role: Role) -> None:
+        """Forbid the agent the given role.
+
+        Args:
+            agent: The agent.
+            role: The role the agent does not have.
+        """
+        self._set_mask(agent, self._masks[self._agent_map[agent]] & ~(1 << GameInfoArrays.role_code(role)))
+
+    def _set_mask(self, agent: Agent, mask: int) -> None:
+        self._masks[self._agent_map[agent]] = mask
+        self._table = None
+
+    def allowed_role_list(self, agent: Agent) -> list[Role]:
+        """Return the roles allowed for the agent by the constraints.
+
+        Args:
+            agent: The agent.
+
+        Returns:
+            The list of the allowed roles.
+        """
+        mask: int = self._masks[self._agent_map[agent]]
+        return [r for r in self._roles if mask >> GameInfoArrays.role_code(r) & 1]
+
+    def _allowed(self, i: int) -> list[int]:
+        return [j for j, c in enumerate(self._codes) if self._masks[i] >> int(c) & 1]
+
+    def _suffix_table(self) -> npt.NDArray[np.int64]:
+        # table[i, s] is the number of the ways to assign the remaining roles s to the agents i and after.
+        if self._table is None:
+            numpy = require_numpy("RoleAssignment")
+            n: int = len(self.agent_list)
+            table: npt.NDArray[np.int64] = numpy.zeros((n + 1, len(self._movable[0]) if self._movable else 1), dtype=numpy.int64)
+            table[n, 0] = 1
+            for i in range(n - 1, -1, -1):
+                for j in self._allowed(i):
+                    movable: npt.NDArray[np.bool_] = self._movable[j]
+                    table[i, movable] += table[i + 1, numpy.flatnonzero(movable) - self._strides[j]]
+            self._table = table
+        return self._table
+
+    def count(self) -> int:
+        """Return the number of the assignments consistent with the constraints.
+
+        Returns:
+            The number of the assignments.
+        """
+        return int(self._suffix_table()[0, self._full])
+
+    def marginals(self) -> npt.NDArray[np.float64]:
+        """Return the probability of each role for each agent over the consistent assignments taken uniformly.
+
+        Returns:
+            The array indexed by the position of the agent in agent_list and the role code,
+            whose rows sum up to 1.
+
+        Raises:
+            ValueError: If no assignment is consistent with the constraints.
+        """
+        numpy = require_numpy("RoleAssignment")
+        table: npt.NDArray[np.int64] = self._suffix_table()
+        total: int = int(table[0, self._full])
+        if total == 0:
+            raise ValueError("No assignment is consistent with the constraints")
+        n: int = len(self.agent_list)
+        counts: npt.NDArray[np.float64] = numpy.zeros((n, len(GameInfoArrays.roles)), dtype=numpy.float64)
+        prefix: npt.NDArray[np.int64] = numpy.zeros(table.shape[1], dtype=numpy.int64)
+        prefix[self._full] = 1
+        for i in range(n):
+            following: npt.NDArray[np.int64] = numpy.zeros_like(prefix)
+            for j in self._allowed(i):
+                source: npt.NDArray[np.int64] = numpy.flatnonzero(self._movable[j])
+                ways: npt.NDArray[np.int64] = prefix[source]
+                counts[i, self._codes[j]] = float(numpy.dot(ways, table[i + 1, source - self._strides[j]]))
+                following[source - self._strides[j]] += ways
+            prefix = following
+        result: npt.NDArray[np.float64] = counts / total
+        return result
+
+    def sample(self, size: int = 1, rng: Optional[Any] = None) -> npt.NDArray[np.int8]:
+        """Draw the consistent assignments uniformly at random.
+
+        Args:
+            size(optional): The number of the assignments to draw. Defaults to 1.
+            rng(optional): The numpy.random.Generator to be used. Defaults to a new one.
+
+        Returns:
+            The array of the role codes indexed by the number of the draw and the position of the agent in agent_list.
+
+        Raises:
+            ValueError: If no assignment is consistent with the constraints.
+        """
+        numpy = require_numpy("RoleAssignment")
+        table: npt.NDArray[np.int64] = self._suffix_table()
+        if table[0, self._full] == 0:
+            raise ValueError("No assignment is consistent with the constraints")
+        generator: Any = rng if rng is not None else numpy.random.default_rng()
+        n: int = len(self.agent_list)
+        result: npt.NDArray[np.int8] = numpy.zeros((size, n), dtype=numpy.int8)
+        states: npt.NDArray[np.int64] = numpy.full(size, self._full, dtype=numpy.int64)
+        for i in range(n):
+            allowed: list[int] = self._allowed(i)
+            weights: npt.NDArray[np.int64] = numpy.zeros((size, len(allowed)), dtype=numpy.int64)
+            for k, j in enumerate(allowed):
+                movable: npt.NDArray[np.bool_] = self._movable[j][states]
+                weights[movable, k] = table[i + 1, states[movable] - self._strides[j]]
+            cumulative: npt.NDArray[np.int64] = numpy.cumsum(weights, axis=1)
+            chosen: npt.NDArray[np.intp] = numpy.argmax(cumulative > generator.integers(0, cumulative[:, -1])[:, None], axis=1)
+            roles: npt.NDArray[np.intp] = numpy.array(allowed, dtype=numpy.intp)[chosen]
+            result[:, i] = self._codes[roles]
+            states -= self._strides[roles]
+        return result
+
+    def __iter__(self) -> Iterator[dict[Agent, Role]]:
+        """Enumerate the consistent assignments.
+
+        Yields:
+            The dict mapping each agent to its role in the assignment.
+        """
+        table: list[list[int]] = self._suffix_table().tolist()
+        n: int = len(self.agent_list)
+        choices: list[list[tuple[Role, int, list[bool]]]] = [[(self._roles[j], int(self._strides[j]), self._movable[j].tolist()) for j in self._allowed(i)]
+                                                             for i in range(n)]
+        roles: list[Role] = [Role.UNC] * n
+
+        def assign(i: int, state: int) -> Iterator[dict[Agent, Role]]:
+            if i == n:
+                yield dict(zip(self.agent_list, roles))
+                return
+            following: list[int] = table[i + 1]
+            for role, stride, movable in choices[i]:
+                if movable[state] and following[state - stride] > 0:
+                    roles[i] = role
+                    yield from assign(i + 1, state - stride)
+
+        if table[0][self._full] > 0:
+            yield from assign(0, self._full)
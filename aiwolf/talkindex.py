@@ -0,0 +1,120 @@
+#
+# talkindex.py
+#
+# Copyright 2022 OTSUKI Takashi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""talkindex module."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Callable, Optional
+
+from aiwolf.agent import Agent, Role, Species
+from aiwolf.content import Content, Topic
+from aiwolf.gameinfo import GameInfo
+from aiwolf.utterance import Utterance, UtteranceLogCursor
+
+
+class TalkIndex:
+    """Index of the talks (or the whispers) in a game by the speaker, the topic, the target,
+    the role, the species, the date and the turn of their top-level Contents.
+
+    The index only grows, so a new TalkIndex should be used for each game.
+    """
+
+    def __init__(self, whisper: bool = False, compile: Callable[[str], Content] = Content.compile) -> None:
+        """Initialize a new instance of TalkIndex.
+
+        Args:
+            whisper(optional): Whether the whispers are indexed instead of the talks. Defaults to False.
+            compile(optional): The function that converts the uttered text into a Content
+                (e.g. ContentCache.compile). Defaults to Content.compile.
+        """
+        self.whisper: bool = whisper
+        """Whether the whispers are indexed instead of the talks."""
+
+        self.utterance_list: list[Utterance] = []
+        """The indexed utterances in the order they were added."""
+
+        self.content_list: list[Content] = []
+        """The Contents of the indexed utterances in the same order as utterance_list."""
+
+        self._compile: Callable[[str], Content] = compile
+        self._posting_map: dict[tuple[str, object], list[int]] = {}
+        self._cursor: UtteranceLogCursor = UtteranceLogCursor()
+
+    def update(self, game_info: GameInfo) -> None:
+        """Index the utterances in the log of the given GameInfo that are not indexed yet.
+
+        Args:
+            game_info: The GameInfo to be reflected.
+        """
+        for u in self._cursor.read(game_info.whisper_log) if self.whisper else self._cursor.read(game_info.talk_log):
+            self.add(u)
+
+    def add(self, utterance: Utterance) -> None:
+        """Index the given utterance.
+
+        Args:
+            utterance: The utterance to be indexed.
+        """
+        content: Content = self._compile(utterance.text)
+        i: int = len(self.utterance_list)
+        self.utterance_list.append(utterance)
+        self.content_list.append(content)
+        for posting_key in (("agent", utterance.agent), ("topic", content.topic), ("target", content.target), ("role", content.role),
+                            ("result", content.result), ("day", utterance.day), ("turn", utterance.turn)):
+            self._posting_map.setdefault(posting_key, []).append(i)
+
+    def query(self, *, agent: Optional[Agent] = None, topic: Optional[Topic] = None, target: Optional[Agent] = None, role: Optional[Role] = None,
+              result: Optional[Species] = None, day: Optional[int] = None, turn: Optional[int] = None) -> list[tuple[Utterance, Content]]:
+        """Return the indexed utterances that match all the given conditions.
+
+        Args:
+            agent(optional): The speaker.
+            topic(optional): The topic of the Content.
+            target(optional): The target of the Content.
+            role(optional): The role of the Content.
+            result(optional): The species of the Content.
+            day(optional): The date of the utterance.
+            turn(optional): The turn of the utterance.
+
+        Returns:
+            The list of the pairs of the matching utterance and its Content in the order they were added.
+            All the indexed ones if no condition is given.
+        """
+        postings: list[list[int]] = []
+        for name, value in (("agent", agent), ("topic", topic), ("target", target), ("role", role), ("result", result), ("day", day), ("turn", turn)):
+            if value is not None:
+                posting: Optional[list[int]] = self._posting_map.get((name, value))
+                if posting is None:
+                    return []
+                postings.append(posting)
+        if not postings:
+            return list(zip(self.utterance_list, self.content_list))
+        postings.sort(key=len)
+        matches: list[int] = postings[0]
+        for posting in postings[1:]:
+            matches = [i for i in matches if TalkIndex._contains(posting, i)]
+            if not matches:
+                break
+        return [(self.utterance_list[i], self.content_list[i]) for i in matches]
+
+    @staticmethod
+    def _contains(posting: list[int], i: int) -> bool:
+        j: int = bisect_left(posting, i)
+        return j < len(posting) and posting[j] == i
+
+    def __len__(self) -> int:
+        return len(self.utterance_list)
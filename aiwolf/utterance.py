@@ -18,7 +18,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Final, TypedDict
+from typing import Callable, Final, Generic, Iterator, Optional, Sequence, TypedDict, TypeVar
 
 from aiwolf.agent import Agent
 from aiwolf.constant import AGENT_NONE
@@ -45,6 +45,8 @@ class _Utterance(TypedDict):
 class Utterance:
     """Class for utterance."""
 
+    __slots__ = ("day", "agent", "idx", "text", "turn")
+
     OVER: Final[str] = "Over"
     """The string that nothing to say."""
 
@@ -86,6 +88,8 @@ class Utterance:
 class Talk(Utterance):
     """Talk class."""
 
+    __slots__ = ()
+
     def __init__(self, day: int = -1, agent: Agent = AGENT_NONE, idx: int = -1, text: str = "", turn: int = -1) -> None:
         """Initialize a new instance of Talk.
 
@@ -120,6 +124,8 @@ class Talk(Utterance):
 class Whisper(Utterance):
     """Whisper class."""
 
+    __slots__ = ()
+
     def __init__(self, day: int = -1, agent: Agent = AGENT_NONE, idx: int = -1, text: str = "", turn: int = -1) -> None:
         """Initialize a new instance of Whisper.
 
@@ -149,3 +155,111 @@ class Whisper(Utterance):
         w.text = utterance["text"]
         w.turn = utterance["turn"]
         return w
+
+
+_U = TypeVar("_U", bound=Utterance)
+
+
+class UtteranceLog(Generic[_U]):
+    """Append-only store of the utterances in a game, which compiles each utterance only once."""
+
+    def __init__(self, compile: Callable[[_Utterance], _U]) -> None:
+        """Initialize a new instance of UtteranceLog.
+
+        Args:
+            compile: The function that converts a _Utterance into the stored utterance (e.g. Talk.compile).
+        """
+        self._compile: Callable[[_Utterance], _U] = compile
+        self._utterance_map: dict[tuple[int, int], _U] = {}
+        self._utterance_list: list[_U] = []
+        self._day_map: dict[int, list[_U]] = {}
+
+    def add(self, utterance: _Utterance) -> _U:
+        """Add the _Utterance to this log unless it is already there.
+
+        Args:
+            utterance: The _Utterance to be added.
+
+        Returns:
+            The utterance stored in this log for the day and the index number of the given _Utterance.
+        """
+        key: tuple[int, int] = (utterance["day"], utterance["idx"])
+        u: Optional[_U] = self._utterance_map.get(key)
+        if u is None:
+            u = self._compile(utterance)
+            self._utterance_map[key] = u
+            self._utterance_list.append(u)
+            self._day_map.setdefault(u.day, []).append(u)
+        return u
+
+    def get(self, day: int, idx: int) -> Optional[_U]:
+        """Return the utterance with the given day and index number.
+
+        Args:
+            day: The date of the utterance.
+            idx: The index number of the utterance.
+
+        Returns:
+            The utterance if it is in this log, otherwise None.
+        """
+        return self._utterance_map.get((day, idx))
+
+    def day_list(self, day: int) -> Sequence[_U]:
+        """Return the utterances on the given day in the order they were added.
+
+        The returned sequence is kept up to date as the utterances are added, so it must not be modified.
+
+        Args:
+            day: The date of the utterances.
+
+        Returns:
+            The sequence of the utterances on the day.
+        """
+        return self._day_map.setdefault(day, [])
+
+    @property
+    def utterance_list(self) -> Sequence[_U]:
+        """All the utterances in this log in the order they were added. It must not be modified."""
+        return self._utterance_list
+
+    def __len__(self) -> int:
+        return len(self._utterance_list)
+
+    def __iter__(self) -> Iterator[_U]:
+        return iter(self._utterance_list)
+
+
+class UtteranceLogCursor:
+    """Reader of the utterances added to an UtteranceLog since the last read, each of which is read only once.
+
+    When a different log is given (e.g. a new GameInfo with its own log), it is read from the beginning,
+    skipping the utterances with the date and the index number already read.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new instance of UtteranceLogCursor."""
+        self._source: Optional[Sequence[Utterance]] = None
+        self._position: int = 0
+        self._key_set: set[tuple[int, int]] = set()
+
+    def read(self, log: UtteranceLog[_U]) -> list[_U]:
+        """Return the utterances in the log that have not been read yet.
+
+        Args:
+            log: The UtteranceLog to be read.
+
+        Returns:
+            The list of the new utterances in the order they were added to the log.
+        """
+        source: Sequence[_U] = log.utterance_list
+        if source is not self._source:
+            self._source = source
+            self._position = 0
+        new: list[_U] = []
+        for i in range(self._position, len(source)):
+            u: _U = source[i]
+            if (u.day, u.idx) not in self._key_set:
+                self._key_set.add((u.day, u.idx))
+                new.append(u)
+        self._position = len(source)
+        return new
@@ -32,6 +32,8 @@ class _Vote(TypedDict):
 class Vote:
     """Information of the vote for execution/attack."""
 
+    __slots__ = ("agent", "day", "target")
+
     def __init__(self, agent: Agent = AGENT_NONE, day: int = -1, target: Agent = AGENT_NONE) -> None:
         """Initialize a new instance of Vote.
 
@@ -0,0 +1,201 @@
+#
+# votetally.py
+#
+# Copyright 2022 OTSUKI Takashi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""votetally module."""
+from __future__ import annotations
+
+from typing import Optional
+
+from aiwolf.agent import Agent
+from aiwolf.gameinfo import GameInfo
+from aiwolf.vote import Vote
+
+
+class VoteRound:
+    """The votes of one round of the vote on a day."""
+
+    __slots__ = ("day", "idx", "votes", "tally", "final")
+
+    def __init__(self, day: int, idx: int, vote_list: list[Vote]) -> None:
+        """Initialize a new instance of VoteRound.
+
+        Args:
+            day: The date of the votes.
+            idx: The index of the round in the day. 0 for the first vote and 1 or more for the revotes.
+            vote_list: The list of the votes in the round.
+        """
+        self.day: int = day
+        """The date of the votes."""
+
+        self.idx: int = idx
+        """The index of the round in the day. 0 for the first vote and 1 or more for the revotes."""
+
+        self.votes: dict[Agent, Agent] = {v.agent: v.target for v in vote_list}
+        """The dict mapping each voter to the agent it voted on."""
+
+        self.tally: dict[Agent, int] = {}
+        """The dict mapping each agent voted on to the number of the votes it got."""
+        for target in self.votes.values():
+            self.tally[target] = self.tally.get(target, 0) + 1
+
+        self.final: bool = False
+        """Whether or not the round is known to be the last one of the day."""
+
+    @property
+    def max_voted_agent_list(self) -> list[Agent]:
+        """The list of the agents that got the most votes in the round."""
+        most: int = max(self.tally.values(), default=0)
+        return [a for a, n in self.tally.items() if n == most]
+
+
+class VoteTally:
+    """Tallies of the votes for execution or attack, kept up to date by update.
+
+    A round is recognized when vote_list or latest_vote_list (or the attack counterparts) changes,
+    and a round identical to the previous one of the same day is regarded as that round.
+    The counts between agents are accumulated over all the rounds of all the days, so a new VoteTally should be used
+    for each game. If the same one is reused, it is reset when the date goes backwards or the player changes, or by reset.
+    """
+
+    def __init__(self, attack: bool = False) -> None:
+        """Initialize a new instance of VoteTally.
+
+        Args:
+            attack(optional): Whether the votes for attack are tallied instead of the ones for execution. Defaults to False.
+        """
+        self.attack: bool = attack
+        """Whether the votes for attack are tallied instead of the ones for execution."""
+
+        self.round_map: dict[int, list[VoteRound]] = {}
+        """The dict mapping each date to the list of the rounds on the day."""
+
+        self._vote_count: dict[tuple[Agent, Agent], int] = {}
+        self._co_vote_count: dict[tuple[Agent, Agent], int] = {}
+        self._voted_count: dict[Agent, int] = {}
+        self._seen: tuple[Optional[list[Vote]], Optional[list[Vote]]] = (None, None)
+        self._day: int = -1
+        self._me: Optional[Agent] = None
+
+    def reset(self) -> None:
+        """Forget all the rounds added so far to start a new game."""
+        self.round_map.clear()
+        self._vote_count.clear()
+        self._co_vote_count.clear()
+        self._voted_count.clear()
+        self._seen = (None, None)
+        self._day = -1
+        self._me = None
+
+    def update(self, game_info: GameInfo) -> None:
+        """Add the rounds newly found in the given GameInfo.
+
+        Args:
+            game_info: The GameInfo to be reflected.
+        """
+        if game_info.day < self._day or self._me is not None and game_info.me is not self._me:
+            self.reset()
+        self._day = game_info.day
+        self._me = game_info.me
+        if self.attack:
+            latest, final = game_info.latest_attack_vote_list, game_info.attack_vote_list
+        else:
+            latest, final = game_info.latest_vote_list, game_info.vote_list
+        seen_latest, seen_final = self._seen
+        if latest is not seen_latest:
+            self._add(latest, False)
+        if final is not seen_final:
+            self._add(final, True)
+        self._seen = (latest, final)
+
+    def _add(self, vote_list: list[Vote], final: bool) -> None:
+        if not vote_list:
+            return
+        day: int = vote_list[0].day
+        rounds: list[VoteRound] = self.round_map.setdefault(day, [])
+        if not rounds or rounds[-1].votes != {v.agent: v.target for v in vote_list}:
+            rounds.append(VoteRound(day, len(rounds), vote_list))
+            self._count(rounds[-1])
+        rounds[-1].final = rounds[-1].final or final
+
+    def _count(self, vote_round: VoteRound) -> None:
+        voters: dict[Agent, list[Agent]] = {}
+        for voter, target in vote_round.votes.items():
+            self._vote_count[voter, target] = self._vote_count.get((voter, target), 0) + 1
+            self._voted_count[target] = self._voted_count.get(target, 0) + 1
+            voters.setdefault(target, []).append(voter)
+        for group in voters.values():
+            for a in group:
+                for b in group:
+                    if a is not b:
+                        self._co_vote_count[a, b] = self._co_vote_count.get((a, b), 0) + 1
+
+    def rounds(self, day: int) -> list[VoteRound]:
+        """Return the rounds of the given day.
+
+        Args:
+            day: The date.
+
+        Returns:
+            The list of the rounds on the day in order. Empty if no vote of the day is known.
+        """
+        return self.round_map.get(day, [])
+
+    def last_round(self, day: int) -> Optional[VoteRound]:
+        """Return the last known round of the given day.
+
+        Args:
+            day: The date.
+
+        Returns:
+            The last known round of the day, or None if no vote of the day is known.
+        """
+        rounds: Optional[list[VoteRound]] = self.round_map.get(day)
+        return rounds[-1] if rounds else None
+
+    def vote_count(self, voter: Agent, target: Agent) -> int:
+        """Return how many times the voter voted on the target.
+
+        Args:
+            voter: The agent that voted.
+            target: The agent voted on.
+
+        Returns:
+            The number of the rounds in which the voter voted on the target.
+        """
+        return self._vote_count.get((voter, target), 0)
+
+    def co_vote_count(self, agent1: Agent, agent2: Agent) -> int:
+        """Return how many times the two agents voted on the same agent.
+
+        Args:
+            agent1: One of the agents.
+            agent2: The other agent.
+
+        Returns:
+            The number of the rounds in which both agents voted on the same agent.
+        """
+        return self._co_vote_count.get((agent1, agent2), 0)
+
+    def voted_count(self, target: Agent) -> int:
+        """Return how many votes the agent got in total.
+
+        Args:
+            target: The agent voted on.
+
+        Returns:
+            The number of the votes the agent got over all the rounds.
+        """
+        return self._voted_count.get(target, 0)
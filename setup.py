@@ -14,6 +14,9 @@ setuptools.setup(
     package_data={
         "aiwolf": ["py.typed"],
     },
+    extras_require={
+        "numpy": ["numpy"],
+    },
     classifiers=[  # see https://pypi.org/pypi?:action=list_classifiers
         # "Development Status :: 3 - Alpha",
         # "Development Status :: 4 - Beta",
@@ -0,0 +1,54 @@
+"""Stress test of the interning of Agent from many threads.
+
+Run with ``python -m unittest discover tests``. On a free-threaded build of Python (e.g. python3.13t),
+the test checks the interning without the GIL as well.
+"""
+import sys
+import threading
+import unittest
+
+from aiwolf import Agent
+
+
+class AgentInterningStressTest(unittest.TestCase):
+    """Every thread must get the same Agent object for the same index."""
+
+    THREADS = 32
+    ROUNDS = 100
+    SPAN = 64
+
+    def setUp(self) -> None:
+        self._interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self) -> None:
+        sys.setswitchinterval(self._interval)
+
+    def test_interning_is_race_free(self) -> None:
+        seen: list[list[list[Agent]]] = [[] for _ in range(self.THREADS)]
+        barrier = threading.Barrier(self.THREADS)
+
+        def work(k: int) -> None:
+            for r in range(self.ROUNDS):
+                # Each round uses fresh indices above the preallocated table, and all the threads start it together.
+                base = 1000 + r * self.SPAN
+                barrier.wait()
+                agents = [Agent(base + (i * 7 + k) % self.SPAN) for i in range(self.SPAN)]
+                agents += [Agent.compile("Agent[%d]" % (base + i)) for i in range(self.SPAN)]
+                agents += [Agent(i) for i in range(256)]
+                seen[k].append(agents)
+
+        threads = [threading.Thread(target=work, args=(k,)) for k in range(self.THREADS)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for r in range(self.ROUNDS):
+            interned: dict[int, Agent] = {}
+            for k in range(self.THREADS):
+                for a in seen[k][r]:
+                    self.assertIs(interned.setdefault(a.agent_idx, a), a, "duplicate Agent for index %d" % a.agent_idx)
+
+
+if __name__ == "__main__":
+    unittest.main()
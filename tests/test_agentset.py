@@ -0,0 +1,62 @@
+"""Comparison of AgentSet with frozenset on random operands.
+
+Run with ``python -m unittest discover tests``.
+"""
+import operator
+import random
+import unittest
+
+from aiwolf import Agent, AgentSet
+
+_AGENTS = [Agent(i) for i in list(range(20)) + [0xff, 300]]
+_OTHERS = [1, "Agent[01]", None]
+
+
+class AgentSetTest(unittest.TestCase):
+    """AgentSet must behave as frozenset, whether the other operand is an AgentSet, a set of Agents or a mixed set."""
+
+    def _check(self, a: frozenset, b: frozenset) -> None:
+        s = AgentSet(a)
+        self.assertEqual(set(s), a)
+        self.assertEqual(len(s), len(a))
+        self.assertEqual(hash(s), hash(a))
+        for x in _AGENTS + _OTHERS:
+            self.assertEqual(x in s, x in a)
+        others = [b, set(b)] + ([AgentSet(b)] if all(isinstance(x, Agent) for x in b) else [])
+        for other in others:
+            for op in (operator.or_, operator.and_, operator.sub, operator.xor):
+                self.assertEqual(op(s, other), op(a, b), (op, a, b))
+                self.assertEqual(op(other, s), op(b, a), (op, b, a))
+            for op in (operator.le, operator.lt, operator.ge, operator.gt, operator.eq, operator.ne):
+                self.assertEqual(op(s, other), op(a, b), (op, a, b))
+                self.assertEqual(op(other, s), op(b, a), (op, b, a))
+            self.assertEqual(s.isdisjoint(other), a.isdisjoint(b))
+
+    def test_random_operands(self) -> None:
+        rng = random.Random(0)
+        for _ in range(2000):
+            a = frozenset(rng.sample(_AGENTS, rng.randint(0, 10)))
+            b = frozenset(rng.sample(_AGENTS, rng.randint(0, 10)))
+            if rng.random() < 0.3:
+                b |= frozenset(rng.sample(_OTHERS, rng.randint(1, 2)))
+            self._check(a, b)
+
+    def test_mixed_operands(self) -> None:
+        a = Agent(1)
+        self.assertFalse(AgentSet([a]) >= {a, 1})
+        self.assertFalse(AgentSet([a]) > {1})
+        self.assertEqual(AgentSet([a]) | {1}, frozenset({a, 1}))
+        self.assertEqual({1} - AgentSet(), {1})
+        self.assertIsInstance(AgentSet([a]) | {Agent(2)}, AgentSet)
+        self.assertIsInstance({Agent(2)} - AgentSet([a]), (set, AgentSet))
+
+    def test_immutable(self) -> None:
+        s = AgentSet([Agent(1)])
+        with self.assertRaises(AttributeError):
+            s.mask = 0  # type: ignore
+        self.assertEqual(repr(s), "AgentSet({Agent[01]})")
+        self.assertEqual(repr(AgentSet()), "AgentSet()")
+
+
+if __name__ == "__main__":
+    unittest.main()